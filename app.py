@@ -3,31 +3,28 @@ import graphviz
 import pandas as pd 
 
 # --- Local Modules ---
-import data_manager 
 import functions 
+import graph_store
+import parallel_scc
+from graph_player import FrameCache, graph_player
+from simulation_worker import SimulationWorker
 
 # --- 1. Visualization Helper ---
-def render_graph(nodes, edges, step_state, algo_type, is_directed):
+def compute_graph_styles(nodes, edges, step_state, algo_type, is_directed):
     """
-    Renders the graph state using Graphviz based on the current step snapshot.
+    Computes the visual style of every node and edge for one step snapshot.
     Handles node coloring (SCC, Visited, Queue) and edge styling (Tree, Back, Cross).
+    Returns (node_styles, edge_styles) aligned with `nodes` / `edges`:
+      node style = (fillcolor, color, penwidth, label), edge style = (color, style, penwidth)
     """
-    if is_directed:
-        dot = graphviz.Digraph(engine='neato')
-    else:
-        dot = graphviz.Graph(engine='neato')
-    
-    # Global Attributes
-    dot.attr(size='5.5,4.5!', ratio='fill', bgcolor='transparent')
-    dot.attr('node', shape='circle', style='filled', fontname='Helvetica', fontsize='10', fixedsize='true', width='0.5')
-    dot.attr('edge', color='#BDC3C7', penwidth='1.2', arrowsize='0.6')
-
     # Unpack State
     visited_set = set(step_state.get("visited", []))
     current_node = step_state.get("current_node", None)
     active_edges = step_state.get("active_edges", [])
     
     levels = step_state.get("levels", {})
+    levels_t = step_state.get("levels_t", {}) # Target-side distances (Bidirectional BFS)
+    path_set = set(step_state.get("path") or [])
     visit_order = step_state.get("visit_order", [])
     in_structure = set(step_state.get("queue", []) + step_state.get("stack", []))
     
@@ -35,13 +32,13 @@ def render_graph(nodes, edges, step_state, algo_type, is_directed):
     scc_groups = step_state.get("scc_groups", {}) 
     scc_colors = ["#FFCDD2", "#C8E6C9", "#BBDEFB", "#FFF9C4", "#E1BEE7", "#FFECB3"]
 
-    # --- Node Rendering ---
+    # --- Node Styles ---
+    node_styles = []
     for node in nodes:
         fillcolor = "#FFFFFF"
-        fontcolor = "#000000"
         penwidth = "1"
         color = "#7F8C8D"
-        label_text = node
+        label_text = str(node)
 
         # Labeling: Show Level (BFS) or Depth (DFS)
         if node in levels:
@@ -49,6 +46,12 @@ def render_graph(nodes, edges, step_state, algo_type, is_directed):
                 label_text = f"{node}\nL{levels[node]}"
             elif algo_type.startswith("DFS"):
                 label_text = f"{node}\nD{levels[node]}"
+            elif algo_type.startswith("Condensation") and node in visited_set: # Levels are final; show popped only
+                label_text = f"{node}\nL{levels[node]}"
+            elif algo_type.startswith("Shortest Path"):
+                label_text = f"{node}\nS{levels[node]}"
+        elif node in levels_t:
+            label_text = f"{node}\nT{levels_t[node]}"
         
         # Priority 1: SCC Coloring
         if algo_type.startswith("SCC") and node in scc_groups:
@@ -72,18 +75,25 @@ def render_graph(nodes, edges, step_state, algo_type, is_directed):
             fillcolor = "#D6EAF8" # Blue
             color = "#3498DB"
 
+        # Priority 4: Final Shortest Path
+        if node in path_set:
+            fillcolor = "#FAD7A0" # Orange
+            color = "#E67E22"
+            penwidth = "2.5"
+
         # Highlight Current Node
         if node == current_node:
             fillcolor = "#F9E79F"
             color = "#F1C40F"
             penwidth = "2.5"
 
-        dot.node(node, label=label_text, fillcolor=fillcolor, color=color, penwidth=penwidth, fontcolor=fontcolor)
+        node_styles.append((fillcolor, color, penwidth, label_text))
 
-    # --- Edge Rendering ---
+    # --- Edge Styles ---
     active_edge_set = set(active_edges)
     edge_types = step_state.get("edge_types", {})
 
+    edge_styles = []
     for u, v in edges:
         edge_key = tuple(sorted((u, v))) if not is_directed else (u, v)
         
@@ -110,11 +120,176 @@ def render_graph(nodes, edges, step_state, algo_type, is_directed):
                 e_color = "#95A5A6"
                 e_style = "dotted"
         
-        dot.edge(u, v, color=e_color, style=e_style, penwidth=e_penwidth)
+        edge_styles.append((e_color, e_style, e_penwidth))
+
+    return node_styles, edge_styles
+
+def render_graph(nodes, edges, step_state, algo_type, is_directed):
+    """
+    Renders the graph state using Graphviz based on the current step snapshot.
+    Nodes/edges get stable SVG ids (n<i> / e<k>) for the incremental renderer.
+    """
+    if is_directed:
+        dot = graphviz.Digraph(engine='neato')
+    else:
+        dot = graphviz.Graph(engine='neato')
+    
+    # Global Attributes
+    dot.attr(size='5.5,4.5!', ratio='fill', bgcolor='transparent')
+    dot.attr('node', shape='circle', style='filled', fontname='Helvetica', fontsize='10', fixedsize='true', width='0.5')
+    dot.attr('edge', color='#BDC3C7', penwidth='1.2', arrowsize='0.6')
+
+    node_styles, edge_styles = compute_graph_styles(nodes, edges, step_state, algo_type, is_directed)
+
+    for i, node in enumerate(nodes):
+        fillcolor, color, penwidth, label_text = node_styles[i]
+        dot.node(str(node), id=f"n{i}", label=label_text, fillcolor=fillcolor, color=color, penwidth=penwidth, fontcolor="#000000")
+
+    for k, (u, v) in enumerate(edges):
+        e_color, e_style, e_penwidth = edge_styles[k]
+        dot.edge(str(u), str(v), id=f"e{k}", color=e_color, style=e_style, penwidth=e_penwidth)
 
     return dot
 
-# --- 2. Streamlit Main App ---
+# --- 2. Background Worker Helpers ---
+def _cancel_worker():
+    """Stops the session's running worker (new run / new data replaces it)."""
+    worker = st.session_state.get("sim_worker")
+    if worker is not None and worker.is_running:
+        worker.cancel()
+
+@st.fragment(run_every=0.5)
+def render_worker_status():
+    """
+    Polls the session's worker without rerunning the whole page.
+    Triggers one full rerun when the worker stops so navigation sees every step.
+    """
+    worker = st.session_state.sim_worker
+    info = worker.progress()
+
+    if info["status"] == "running":
+        total = max(info["total_nodes"], 1)
+        st.progress(min(info["nodes_visited"] / total, 1.0))
+        st.caption(f"⏳ Generating... {info['nodes_visited']}/{info['total_nodes']} nodes visited | "
+                   f"{info['steps_emitted']} steps | {info['elapsed']:.1f}s")
+        if st.button("⛔ Cancel Simulation", use_container_width=True):
+            worker.cancel()
+            worker.join(timeout=1.0)
+            st.rerun()
+        # Refresh the main view once the first steps are available
+        if st.session_state.get("worker_first_steps") is not worker and info["steps_emitted"] > 0:
+            st.session_state.worker_first_steps = worker
+            st.rerun(scope="app")
+        return
+
+    if st.session_state.get("worker_reported") is not worker:
+        st.session_state.worker_reported = worker
+        st.rerun(scope="app")
+
+    if info["status"] == "done":
+        st.caption(f"✅ Generated {info['steps_emitted']} steps in {info['elapsed']:.2f}s")
+    elif info["status"] == "cancelled":
+        st.warning(f"Cancelled after {info['steps_emitted']} steps.")
+    elif info["status"] == "error":
+        st.error(f"Simulation failed: {worker.error}")
+
+# --- 3. Shared Graph Store Helpers ---
+def _load_graph(content, numeric_ids):
+    """
+    Attach this session to the process-wide graph store. Sessions loading the
+    same content share one parsed graph (nodes/edges/adjacency) instead of copies.
+    """
+    _cancel_worker()
+    previous = st.session_state.get("graph_handle")
+    handle = graph_store.get_store().acquire(content, numeric_ids=numeric_ids)
+    if previous is not None:
+        previous.release()
+
+    graph = handle.graph
+    st.session_state.graph_handle = handle
+    st.session_state.nodes = graph.nodes
+    st.session_state.edges = graph.edges
+    st.session_state.is_simulating = False
+    st.session_state.component_stats = graph.component_stats()
+    st.session_state.scc_stats = None
+    return graph
+
+def _current_graph():
+    handle = st.session_state.get("graph_handle")
+    return handle.graph if handle is not None else None
+
+def _node_search_index():
+    graph = _current_graph()
+    if graph is not None:
+        return graph.search_index() # Built once per graph, shared by every session
+    return functions.build_node_search_index(st.session_state.nodes)
+
+def node_picker(label, key, default_query="", allow_empty=False, k=50):
+    """
+    Search-as-you-type node selector. Only the top-k matches for the typed
+    prefix/substring reach the browser, so reruns stay light on huge graphs.
+    Returns the chosen label, or None (no match / empty query with allow_empty).
+    """
+    query = st.text_input(f"🔎 {label}", value=default_query, key=f"{key}_query",
+                          placeholder="Type a prefix or substring")
+    if allow_empty and not query.strip():
+        return None
+    matches = functions.search_nodes(_node_search_index(), query, k)
+    if not matches:
+        st.caption("No matching node.")
+        return None
+    return st.selectbox(label, matches, key=key, label_visibility="collapsed")
+
+def _view_position(view_nodes, current_state, node):
+    """Index of `node` in the drawn view (its super-node in Condensation mode), or None."""
+    members = current_state.get("dag_members")
+    if members is not None:
+        for i, label in enumerate(view_nodes):
+            if node in members.get(label, []):
+                return i
+        return None
+    pos = functions.locate_node(_node_search_index(), node)
+    return pos if pos != -1 else None
+
+# --- 4. Incremental Renderer Helpers ---
+def _render_player(steps, idx, view_nodes, view_edges, algo_type, fps, focus=None):
+    """
+    Lays the graph out once (server-side SVG), then ships only per-step style
+    deltas to the browser player. Returns False if Graphviz cannot produce SVG
+    here, so the caller falls back to st.graphviz_chart.
+    """
+    is_directed = st.session_state.is_directed
+    token = f"{id(steps)}:{algo_type}:{is_directed}" # One layout per simulation run
+    cache = st.session_state.get("player_cache")
+
+    if cache is None or cache.token != token:
+        base = render_graph(view_nodes, view_edges, {}, algo_type, is_directed)
+        try:
+            svg = base.pipe(format="svg").decode("utf-8")
+        except graphviz.ExecutableNotFound:
+            st.warning("Graphviz executable not found: falling back to full re-rendering.")
+            return False
+        cache = FrameCache(token, svg)
+        st.session_state.player_cache = cache
+
+    cache.extend(steps, lambda state: compute_graph_styles(view_nodes, view_edges, state, algo_type, is_directed))
+    svg, frames_from, new_frames = cache.pending() # SVG once per run, frames once each
+    event = graph_player(svg, token, new_frames, frames_from, step=idx, fps=fps, focus=focus, key="graph_player")
+
+    # Each browser event is handled once (the component keeps returning the last one)
+    if event is not None and event.get("svg_id") == token and event.get("id") != st.session_state.get("player_event"):
+        st.session_state.player_event = event.get("id")
+        if event.get("resync"):
+            cache.resync()
+            st.rerun()
+        # Pause / manual navigation: sync the side panels (also after server-side Prev/Next)
+        reported = event.get("step")
+        if reported is not None and reported != idx and 0 <= reported < len(steps):
+            st.session_state.current_step_idx = reported
+            st.rerun()
+    return True
+
+# --- 5. Streamlit Main App ---
 def main():
     st.set_page_config(page_title="Graph Algo Viz", layout="wide", page_icon="🕸️")
     
@@ -130,6 +305,11 @@ def main():
     if 'is_simulating' not in st.session_state: st.session_state.is_simulating = False
     if 'algo_type' not in st.session_state: st.session_state.algo_type = "BFS"
     if 'is_directed' not in st.session_state: st.session_state.is_directed = False
+    if 'numeric_ids' not in st.session_state: st.session_state.numeric_ids = False
+    if 'sim_worker' not in st.session_state: st.session_state.sim_worker = None
+    if 'component_stats' not in st.session_state: st.session_state.component_stats = None
+    if 'graph_handle' not in st.session_state: st.session_state.graph_handle = None
+    if 'use_player' not in st.session_state: st.session_state.use_player = False
 
     # --- Sidebar (Controls) ---
     with st.sidebar:
@@ -137,6 +317,10 @@ def main():
         
         is_directed = st.toggle("Directed Graph (유향)", value=st.session_state.is_directed)
         st.session_state.is_directed = is_directed
+
+        # Integer ids -> native int arrays with numeric ordering (2 < 10)
+        numeric_ids = st.toggle("Numeric Node IDs (1, 2, 10...)", value=st.session_state.numeric_ids)
+        st.session_state.numeric_ids = numeric_ids
         
         default_input = "A B\nA C\nB D\nC E\nC F\nE F" if not is_directed else "A B\nB D\nB C\nC E\nE F"
         
@@ -144,71 +328,124 @@ def main():
         with tab1:
             raw_text = st.text_area("Edge List", value=default_input, height=150)
             if st.button("Load Text"):
-                nodes, edges = data_manager.parse_edge_list(raw_text)
-                st.session_state.nodes = nodes
-                st.session_state.edges = edges
-                st.session_state.is_simulating = False
-                st.success(f"Loaded {len(nodes)} nodes")
+                graph = _load_graph(raw_text, numeric_ids)
+                st.success(f"Loaded {len(graph.nodes)} nodes")
         with tab2:
             uploaded = st.file_uploader("Upload .txt", type="txt")
             if uploaded and st.button("Load File"):
                 content = uploaded.getvalue().decode("utf-8")
-                nodes, edges = data_manager.parse_edge_list(content)
-                st.session_state.nodes = nodes
-                st.session_state.edges = edges
-                st.session_state.is_simulating = False
+                _load_graph(content, numeric_ids)
                 st.success("File Loaded")
 
+        # Union-Find component statistics (computed once per load, no adjacency needed)
+        stats = st.session_state.component_stats
+        if stats is not None and st.session_state.nodes:
+            sizes = stats["sizes"]
+            label = "🔗 Weak Components" if is_directed else "🔗 Components"
+            s_col1, s_col2, s_col3 = st.columns(3)
+            s_col1.metric(label, stats["count"])
+            s_col2.metric("📏 Largest", max(sizes) if sizes else 0)
+            s_col3.metric("⚪ Isolated", sum(1 for size in sizes if size == 1))
+
+        # Multi-core SCC summary (result only, no steps): for graphs too large to trace
+        if is_directed and st.session_state.nodes:
+            if st.button("⚡ Count SCCs (Multi-core)", use_container_width=True):
+                result = parallel_scc.compute_scc_parallel(st.session_state.nodes, st.session_state.edges)
+                scc_sizes = [len(group) for group in result["components"]]
+                st.session_state.scc_stats = {
+                    "count": len(scc_sizes),
+                    "largest": max(scc_sizes, default=0),
+                    "trivial": sum(1 for size in scc_sizes if size == 1),
+                }
+            scc_stats = st.session_state.get("scc_stats")
+            if scc_stats is not None:
+                c_col1, c_col2, c_col3 = st.columns(3)
+                c_col1.metric("📦 SCCs", scc_stats["count"])
+                c_col2.metric("📏 Largest", scc_stats["largest"])
+                c_col3.metric("⚪ Trivial", scc_stats["trivial"])
+
         st.divider()
         st.header("2️⃣ Algorithm Selection")
         
         if st.session_state.nodes:
-            algo_options = ["BFS (Breadth-First)", "DFS (Depth-First)", "Topological Sort", "SCC (Kosaraju)"]
+            algo_options = ["BFS (Breadth-First)", "DFS (Depth-First)", "Topological Sort", "SCC (Kosaraju)", "Condensation DAG (SCC)", "Shortest Path (Bidirectional BFS)"]
             algo = st.selectbox("Choose Algorithm", algo_options)
             
             # Start Node selection (Enabled for all algos to define traversal order)
-            start_node = st.selectbox("Start Node", st.session_state.nodes)
+            start_node = node_picker("Start Node", key="start_node")
+
+            # Step granularity (BFS/DFS): bounds trace length on large graphs
+            engine_options = {}
+            if algo.startswith(("BFS", "DFS")):
+                granularity_labels = {
+                    "Auto (fit budget)": "auto",
+                    "Per Edge": "edge",
+                    "Per Node": "node",
+                    "Per BFS Level / DFS Tree": "level",
+                    "Per Component": "component",
+                }
+                granularity = st.selectbox("Step Granularity", list(granularity_labels), index=1)
+                engine_options["granularity"] = granularity_labels[granularity]
+                if engine_options["granularity"] == "auto":
+                    engine_options["step_budget"] = st.number_input(
+                        "Step Budget", min_value=10, value=functions.DEFAULT_STEP_BUDGET, step=500)
+                    engine_options["memory_budget_mb"] = st.number_input(
+                        "Memory Budget (MB)", min_value=16, value=functions.DEFAULT_MEMORY_BUDGET_MB, step=64)
+            elif algo.startswith("Shortest Path"):
+                engine_options["target_node"] = node_picker("Target Node", key="target_node",
+                                                            default_query=str(st.session_state.nodes[-1]))
             
-            if st.button("🚀 Initialize Simulation", use_container_width=True):
+            if st.button("🚀 Initialize Simulation", use_container_width=True, disabled=start_node is None):
                 st.session_state.algo_type = algo
-                steps = []
+                engine = None
 
-                # Execute Backend Logic (Passing strict keyword arguments)
+                # Select Backend Logic (executed on a background worker)
                 if algo.startswith("BFS"):
-                    steps = functions.run_bfs_simulation(
-                        st.session_state.nodes, st.session_state.edges, start_node, is_directed
-                    )
+                    engine = functions.run_bfs_simulation
                 elif algo.startswith("DFS"):
-                    steps = functions.run_dfs_simulation(
-                        st.session_state.nodes, st.session_state.edges, start_node, is_directed
-                    )
+                    engine = functions.run_dfs_simulation
                 elif algo == "Topological Sort":
                     if not is_directed:
                         st.error("Topological Sort requires a Directed Graph.")
                     else:
-                        steps = functions.run_topological_sort_simulation(
-                            nodes=st.session_state.nodes, 
-                            edges=st.session_state.edges, 
-                            start_node=start_node, 
-                            is_directed=is_directed
-                        )
+                        engine = functions.run_topological_sort_simulation
                 elif algo.startswith("SCC"):
                     if not is_directed:
                         st.error("SCC requires a Directed Graph.")
                     else:
-                        steps = functions.run_scc_kosaraju_ui(
-                            nodes=st.session_state.nodes, 
-                            edges=st.session_state.edges, 
-                            start_node=start_node, 
-                            is_directed=is_directed
-                        )
+                        engine = functions.run_scc_kosaraju_ui
+                elif algo.startswith("Condensation"):
+                    if not is_directed:
+                        st.error("Condensation DAG requires a Directed Graph.")
+                    else:
+                        engine = functions.run_condensation_simulation
+                elif algo.startswith("Shortest Path"):
+                    engine = functions.run_bidirectional_bfs_simulation
                 
-                if steps:
-                    st.session_state.simulation_steps = steps
+                if engine is not None:
+                    _cancel_worker()
+                    # Passing strict keyword arguments
+                    worker = SimulationWorker(
+                        engine,
+                        total_nodes=len(st.session_state.nodes),
+                        nodes=st.session_state.nodes, 
+                        edges=st.session_state.edges, 
+                        start_node=start_node, 
+                        is_directed=is_directed,
+                        graph=_current_graph(), # Shared read-only adjacency
+                        **engine_options
+                    ).start()
+                    st.session_state.sim_worker = worker
+                    st.session_state.simulation_steps = worker.steps # Grows while the worker runs
                     st.session_state.current_step_idx = 0
                     st.session_state.is_simulating = True
                     st.rerun()
 
+        # Background run status (progress + cancel)
+        if st.session_state.sim_worker is not None:
+            st.divider()
+            render_worker_status()
+
     # --- Main Visualization Area ---
     if st.session_state.is_simulating and st.session_state.simulation_steps:
         steps = st.session_state.simulation_steps
@@ -222,18 +459,33 @@ def main():
         # --- [Left] Graph Visualization ---
         with col_viz:
             st.subheader(f"🖼️ {algo_type} View")
-            dot_obj = render_graph(
-                st.session_state.nodes, 
-                st.session_state.edges, 
-                current_state, 
-                algo_type,
-                st.session_state.is_directed
-            )
-            st.graphviz_chart(dot_obj, use_container_width=True)
+            # Condensation mode draws the super-node DAG instead of the raw graph
+            view_nodes = current_state.get("dag_nodes", st.session_state.nodes)
+            view_edges = current_state.get("dag_edges", st.session_state.edges)
+
+            p_col1, p_col2 = st.columns([3, 2])
+            with p_col1:
+                use_player = st.toggle("⚡ Client-side Player (style deltas + autoplay)", value=st.session_state.use_player)
+                st.session_state.use_player = use_player
+            with p_col2:
+                fps = st.slider("Autoplay FPS", 0.5, 30.0, 4.0, 0.5, disabled=not use_player)
+
+            # Jump to Node: centers the player frame on the node (fallback: outlines it)
+            jump_node = node_picker("Jump to Node", key="jump_node", allow_empty=True)
+            focus = _view_position(view_nodes, current_state, jump_node) if jump_node is not None else None
+
+            svg_ready = use_player and _render_player(steps, idx, view_nodes, view_edges, algo_type, fps, focus)
+            if not svg_ready:
+                dot_obj = render_graph(view_nodes, view_edges, current_state, algo_type, st.session_state.is_directed)
+                if focus is not None:
+                    dot_obj.node(str(view_nodes[focus]), color="#E74C3C", penwidth="4")
+                st.graphviz_chart(dot_obj, use_container_width=True)
             
             # Legend
             if algo_type.startswith("SCC"):
                 st.caption("🎨 Colors represent different SCC groups")
+            elif algo_type.startswith("Condensation"):
+                st.caption("🧩 Each node C# is one SCC | L# = Level in the condensation DAG")
             else:
                 st.caption("🟦 Blue: Tree Edge | 🟥 Red Dashed: Back Edge | ⬜ Gray Dotted: Cross/Forward")
             
@@ -250,7 +502,8 @@ def main():
             with c2:
                 progress = (idx + 1) / len(steps)
                 st.progress(progress)
-                st.caption(f"Step {idx} / {len(steps)-1}")
+                generating = st.session_state.sim_worker is not None and st.session_state.sim_worker.is_running
+                st.caption(f"Step {idx} / {len(steps)-1}" + (" (generating...)" if generating else ""))
             with c3:
                 if st.button("Next ➡️", disabled=(idx==len(steps)-1), use_container_width=True):
                     st.session_state.current_step_idx += 1
@@ -272,8 +525,12 @@ def main():
             # Display Metrics
             m_col1, m_col2 = st.columns(2)
             with m_col1:
-                label_comp = "📦 Found SCCs" if algo_type.startswith("SCC") else "🔗 Components"
-                st.metric(label=label_comp, value=current_comp_count)
+                if algo_type.startswith("Shortest Path"):
+                    hops = current_state.get("hops")
+                    st.metric(label="📏 Hops", value=hops if hops is not None else "-")
+                else:
+                    label_comp = "📦 Found SCCs" if algo_type.startswith(("SCC", "Condensation")) else "🔗 Components"
+                    st.metric(label=label_comp, value=current_comp_count)
             with m_col2:
                 if algo_type in ["BFS (Breadth-First)", "DFS (Depth-First)"]:
                     st.metric(label="🌲 Tree Edges", value=tree_edge_count)
@@ -334,7 +591,35 @@ def main():
                 if not visit_order:
                     st.info("Searching... No nodes sorted yet.")
                 else:
-                    st.success(f"**Current Order:** {' → '.join(visit_order)}")
+                    st.success(f"**Current Order:** {' → '.join(map(str, visit_order))}")
+
+            elif algo_type.startswith("Condensation"):
+                st.markdown("**🧩 Component-level Topological Order:**")
+                visit_order = current_state.get("visit_order", [])
+                members = current_state.get("dag_members", {})
+                levels = current_state.get("levels", {})
+
+                if not visit_order:
+                    st.info("No components ordered yet.")
+                else:
+                    st.success(f"**Current Order:** {' → '.join(map(str, visit_order))}")
+                    with st.container(height=200, border=True):
+                        for label in visit_order:
+                            st.markdown(f"**{label}** (L{levels.get(label, 0)}) : {members.get(label, [])}")
+
+            elif algo_type.startswith("Shortest Path"):
+                st.markdown("**🛣️ Shortest Path (Result):**")
+                path = current_state.get("path")
+                touched = len(current_state.get("visited", []))
+
+                if path is None:
+                    st.info(f"Searching... {touched} / {len(st.session_state.nodes)} nodes touched.")
+                elif not path:
+                    st.warning(f"No path exists. ({touched} / {len(st.session_state.nodes)} nodes touched)")
+                else:
+                    st.success(f"**Path ({len(path) - 1} hops):** {' → '.join(map(str, path))}")
+                    st.caption(f"Touched {touched} of {len(st.session_state.nodes)} nodes "
+                               f"(S = distance from start, T = distance to target)")
 
             elif algo_type.startswith("SCC"):
                 st.markdown("**📦 Identified SCC Groups:**")
@@ -374,12 +659,14 @@ def main():
             header_nodes, matrix = functions.get_adjacency_matrix(
                 st.session_state.nodes, 
                 st.session_state.edges, 
-                st.session_state.is_directed
+                st.session_state.is_directed,
+                graph=_current_graph()
             )
             adj_list_txt = functions.get_adjacency_list_text(
                 st.session_state.nodes, 
                 st.session_state.edges, 
-                st.session_state.is_directed
+                st.session_state.is_directed,
+                graph=_current_graph()
             )
             
             d_col1, d_col2 = st.columns(2)
@@ -393,6 +680,35 @@ def main():
                 st.caption("Storage: `O(V^2)`")
                 st.dataframe(pd.DataFrame(matrix, columns=header_nodes, index=header_nodes))
 
+            st.markdown("**3️⃣ Reachability Matrix (Transitive Closure)**")
+            # Expander bodies run on every rerun even when collapsed: build only on request
+            if not st.toggle("Build Reachability Index", key="show_reachability"):
+                st.caption("Off: the index and the `O(V^2)` matrix are not built.")
+            else:
+                # Transitive closure: built once per graph (shared store), then O(1) per query
+                graph = _current_graph()
+                is_d = st.session_state.is_directed
+                reach_index = graph.reachability_index(is_d) if graph is not None else \
+                    functions.compute_reachability_index(st.session_state.nodes, st.session_state.edges, is_d)
+                storage = f"bit-packed over {reach_index['count']} SCCs" if is_d else \
+                    f"component ids ({reach_index['count']} components)"
+                st.caption(f"Storage: {storage}, {reach_index['nbytes']:,} bytes · Query: `O(1)`")
+                r_col1, r_col2 = st.columns(2)
+                with r_col1:
+                    src = node_picker("From", key="reach_src")
+                with r_col2:
+                    dst = node_picker("To", key="reach_dst")
+                if src is not None and dst is not None:
+                    if functions.is_reachable(reach_index, src, dst):
+                        st.success(f"{src} can reach {dst}.")
+                    else:
+                        st.warning(f"{src} cannot reach {dst}.")
+                if st.toggle("Show Matrix", key="show_reachability_matrix"):
+                    reach_nodes, reach_matrix = functions.get_reachability_matrix(
+                        st.session_state.nodes, st.session_state.edges, is_d, index=reach_index
+                    )
+                    st.dataframe(pd.DataFrame(reach_matrix, columns=reach_nodes, index=reach_nodes))
+
     else:
         # Initial State (No Simulation)
         st.info("👈 Select Algorithm from Sidebar and Click 'Initialize'")
@@ -404,7 +720,7 @@ def main():
             dot.attr('node', shape='circle', style='filled', fillcolor='white', width='0.5', fontsize='10')
             
             for u, v in st.session_state.edges:
-                dot.edge(u, v)
+                dot.edge(str(u), str(v))
             st.graphviz_chart(dot, use_container_width=True)
 
 if __name__ == "__main__":
@@ -0,0 +1,330 @@
+# cli.py
+"""
+Headless runner for the graph algorithms in `functions.py`.
+
+Usage:
+    python cli.py dumps/ extra.txt --algo bfs scc --directed --out-dir results
+    python cli.py dumps/ --mode trace --format json --workers 8
+
+Every input file is parsed with `data_manager.parse_edge_list`. Trace mode
+runs the same `run_*` engines the Streamlit app uses; result mode runs the
+result-only `compute_*` engines, which return the same final snapshot without
+recording steps. Files are spread across a process pool, so one worker
+handles one file end-to-end, including writing its JSON / trace CSV; the
+parent only keeps small per-file summaries for results.csv and timings.csv. `scc-par` (result mode only) runs the
+multi-core `parallel_scc` engine inside that worker; for one huge file use
+`--workers 1 --scc-workers N`.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# --- Local Modules ---
+import data_manager
+import functions
+import parallel_scc
+
+# Algorithm key -> (display name, trace engine or None, result engine, requires directed graph)
+ALGORITHMS = {
+    "bfs":  ("BFS (Breadth-First)", functions.run_bfs_simulation, functions.compute_bfs, False),
+    "dfs":  ("DFS (Depth-First)", functions.run_dfs_simulation, functions.compute_dfs, False),
+    "topo": ("Topological Sort", functions.run_topological_sort_simulation, functions.compute_topological_order, True),
+    "scc":  ("SCC (Kosaraju)", functions.run_scc_kosaraju_ui, functions.compute_scc, True),
+    "dag":  ("Condensation DAG (SCC)", functions.run_condensation_simulation, functions.compute_condensation_snapshot, True),
+    "scc-par": ("SCC (Parallel FW-BW)", None, parallel_scc.compute_scc_parallel_snapshot, True),
+}
+
+CSV_FIELDS = ["file", "algo", "status", "nodes", "edges", "steps",
+              "component_count", "visit_order", "scc_groups", "seconds", "log"]
+
+
+# ============================================================
+# Input Collection
+# ============================================================
+def collect_input_files(paths, pattern_ext=".txt"):
+    """
+    Expand the given files/directories into a sorted list of edge-list files.
+    Directories are walked recursively and filtered by extension.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in names:
+                    if not pattern_ext or name.endswith(pattern_ext):
+                        files.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"⚠️ Skipping missing path: {path}", file=sys.stderr)
+    return sorted(files)
+
+
+# ============================================================
+# Worker (runs inside the process pool)
+# ============================================================
+def process_file(path, algo_keys, mode, is_directed, start_node, numeric_ids=False, granularity="edge",
+                 scc_workers=None):
+    """
+    Parse one edge-list file and run every requested algorithm on it.
+    Returns a plain dict (picklable) with per-algorithm results and timings.
+    """
+    t0 = time.perf_counter()
+    with open(path, "r", encoding="utf-8") as f:
+        nodes, edges = data_manager.parse_edge_list(f.read(), numeric_ids=numeric_ids)
+    parse_seconds = time.perf_counter() - t0
+
+    report = {
+        "file": path,
+        "nodes": len(nodes),
+        "edges": len(edges),
+        "is_directed": is_directed,
+        "parse_seconds": parse_seconds,
+        "results": {},
+    }
+
+    if start_node is not None and not isinstance(nodes, list):
+        # Integer id array: --start arrives as text
+        try:
+            start_node = int(start_node)
+        except ValueError:
+            start_node = None
+    root = start_node if start_node in nodes else (nodes[0] if nodes else None)
+
+    for key in algo_keys:
+        algo_name, trace_engine, result_engine, needs_directed = ALGORITHMS[key]
+        entry = {"algo": algo_name}
+
+        if needs_directed and not is_directed:
+            entry["status"] = "skipped"
+            entry["log"] = f"{algo_name} requires a Directed Graph."
+            entry["seconds"] = 0.0
+            report["results"][key] = entry
+            continue
+        if mode == "trace" and trace_engine is None:
+            entry["status"] = "skipped"
+            entry["log"] = f"{algo_name} has no step trace; use --mode result."
+            entry["seconds"] = 0.0
+            report["results"][key] = entry
+            continue
+
+        t1 = time.perf_counter()
+        if mode == "result":
+            # No snapshots: O(V + E) per algorithm
+            options = {"workers": scc_workers} if key == "scc-par" else {}
+            entry["final"] = result_engine(nodes, edges, root, is_directed, **options)
+        else:
+            # Step granularity only applies to the BFS/DFS traces
+            options = {"granularity": granularity} if key in ("bfs", "dfs") else {}
+            try:
+                steps = trace_engine(nodes, edges, root, is_directed, **options)
+            except functions.TraceBudgetError as exc:
+                # granularity="auto" could not fit even one snapshot
+                entry["status"] = "error"
+                entry["log"] = str(exc)
+                entry["seconds"] = time.perf_counter() - t1
+                report["results"][key] = entry
+                continue
+            entry["final"] = steps[-1] if steps else {}
+            entry["steps"] = len(steps)
+            entry["trace"] = steps
+        entry["seconds"] = time.perf_counter() - t1
+        entry["status"] = "ok"
+        report["results"][key] = entry
+
+    report["total_seconds"] = time.perf_counter() - t0
+    return report
+
+def run_file(path, out_path, fmt, algo_keys, mode, is_directed, start_node, numeric_ids=False,
+             granularity="edge", scc_workers=None):
+    """
+    Pool task: process one file, write its own output file right here, and hand
+    back only a small summary. Traces never travel to (or pile up in) the parent.
+    """
+    report = process_file(path, algo_keys, mode, is_directed, start_node, numeric_ids, granularity, scc_workers)
+    if out_path is not None:
+        write_file_output(report, out_path, fmt)
+    return summarize_report(report)
+
+
+# ============================================================
+# Output Writers
+# ============================================================
+def _to_jsonable(obj):
+    """Snapshots use tuple keys for edge_types; JSON only allows str keys."""
+    if isinstance(obj, dict):
+        converted = {}
+        for k, v in obj.items():
+            if isinstance(k, tuple):
+                k = " ".join(str(x) for x in k)
+            converted[str(k)] = _to_jsonable(v)
+        return converted
+    if isinstance(obj, (list, tuple)):
+        return [_to_jsonable(x) for x in obj]
+    return obj
+
+def _unique_output_name(path, used_names, ext):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = f"{stem}{ext}"
+    counter = 1
+    while name in used_names:
+        name = f"{stem}_{counter}{ext}"
+        counter += 1
+    used_names.add(name)
+    return name
+
+def output_paths(files, out_dir, fmt, mode):
+    """
+    Per-input output file, decided up front in input order so workers can write
+    their own files without clashing.
+    json: <file>.json per input / csv: <file>_trace.csv in trace mode, else None.
+    """
+    if fmt == "csv" and mode != "trace":
+        return {path: None for path in files}
+    ext = ".json" if fmt == "json" else "_trace.csv"
+    used_names = set()
+    return {path: os.path.join(out_dir, _unique_output_name(path, used_names, ext)) for path in files}
+
+def _csv_rows(report):
+    rows = []
+    for key, entry in report["results"].items():
+        final = entry.get("final", {})
+        rows.append({
+            "file": report["file"],
+            "algo": key,
+            "status": entry["status"],
+            "nodes": report["nodes"],
+            "edges": report["edges"],
+            "steps": entry.get("steps", ""), # Trace mode only
+            "component_count": final.get("component_count", ""),
+            "visit_order": " ".join(map(str, final.get("visit_order", []))),
+            "scc_groups": json.dumps(final.get("scc_groups", {})) if "scc_groups" in final else "",
+            "seconds": f"{entry['seconds']:.6f}",
+            "log": final.get("log", entry.get("log", "")),
+        })
+    return rows
+
+def write_file_output(report, out_path, fmt):
+    """
+    json: the full report (trace included in trace mode).
+    csv : <file>_trace.csv, one row per step (trace mode only).
+    """
+    if fmt == "json":
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(_to_jsonable(report), f, ensure_ascii=False, indent=2)
+        return
+
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["algo", "step", "log", "visited", "component_count"])
+        for key, entry in report["results"].items():
+            for i, step in enumerate(entry.get("trace", [])):
+                writer.writerow([key, i, step["log"], " ".join(map(str, step.get("visited", []))),
+                                 step.get("component_count", "")])
+
+def summarize_report(report):
+    """What the parent keeps per file: results.csv rows + per-algorithm status/timing."""
+    summary = {key: report[key] for key in ("file", "nodes", "edges", "parse_seconds", "total_seconds")}
+    summary["results"] = {key: {"status": entry["status"], "seconds": entry["seconds"]}
+                          for key, entry in report["results"].items()}
+    summary["rows"] = _csv_rows(report)
+    return summary
+
+def write_results_csv(summaries, out_dir):
+    """A single results.csv with one row per (file, algo)."""
+    with open(os.path.join(out_dir, "results.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for summary in summaries:
+            writer.writerows(summary["rows"])
+
+def write_timing_summary(reports, out_dir, wall_seconds):
+    """Writes timings.csv and prints an aggregated per-algorithm summary."""
+    totals = {key: [0, 0.0] for key in ALGORITHMS}
+    with open(os.path.join(out_dir, "timings.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["file", "nodes", "edges", "parse_seconds"] + [f"{k}_seconds" for k in ALGORITHMS] + ["total_seconds"])
+        for report in reports:
+            row = [report["file"], report["nodes"], report["edges"], f"{report['parse_seconds']:.6f}"]
+            for key in ALGORITHMS:
+                entry = report["results"].get(key)
+                if entry and entry["status"] == "ok":
+                    totals[key][0] += 1
+                    totals[key][1] += entry["seconds"]
+                    row.append(f"{entry['seconds']:.6f}")
+                else:
+                    row.append("")
+            row.append(f"{report['total_seconds']:.6f}")
+            writer.writerow(row)
+
+    print(f"✅ Processed {len(reports)} file(s) in {wall_seconds:.3f}s (wall clock)")
+    for key, (count, seconds) in totals.items():
+        if count:
+            print(f"  • {key:<7} runs={count:<6} total={seconds:.3f}s  avg={seconds / count:.6f}s")
+
+
+# ============================================================
+# Entry Point
+# ============================================================
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Run graph algorithms over edge-list files without the UI.")
+    parser.add_argument("paths", nargs="+", help="Edge-list files or directories (searched recursively).")
+    parser.add_argument("--algo", nargs="+", choices=list(ALGORITHMS), default=["bfs"],
+                        help="Algorithms to run on every file.")
+    parser.add_argument("--mode", choices=["result", "trace"], default="result",
+                        help="result: final snapshot only (no steps recorded) / trace: every step snapshot.")
+    parser.add_argument("--directed", action="store_true", help="Treat edges as directed.")
+    parser.add_argument("--start", default=None, help="Start node (falls back to the first node).")
+    parser.add_argument("--numeric", action="store_true",
+                        help="Keep all-integer node ids as int arrays (numeric ordering, faster lookups).")
+    parser.add_argument("--granularity", choices=["auto"] + functions.GRANULARITY_LEVELS, default="edge",
+                        help="BFS/DFS step granularity (auto = finest level within the default step budget).")
+    parser.add_argument("--format", choices=["json", "csv"], default="json", dest="fmt")
+    parser.add_argument("--out-dir", default="results", help="Directory for output files.")
+    parser.add_argument("--ext", default=".txt", help="File extension filter for directories ('' = all).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Process pool size (default: CPU count).")
+    parser.add_argument("--scc-workers", type=int, default=None,
+                        help="Pool size of the scc-par engine inside each file worker (default: CPU count).")
+    return parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    files = collect_input_files(args.paths, args.ext)
+    if not files:
+        print("❌ No input files found.", file=sys.stderr)
+        return 1
+
+    t0 = time.perf_counter()
+    os.makedirs(args.out_dir, exist_ok=True)
+    out_paths = output_paths(files, args.out_dir, args.fmt, args.mode)
+    summaries = []
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Each worker writes its own JSON / trace file; only summaries come back
+        futures = {
+            pool.submit(run_file, path, out_paths[path], args.fmt, args.algo, args.mode, args.directed,
+                        args.start, args.numeric, args.granularity, args.scc_workers): path
+            for path in files
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                summaries.append(future.result())
+            except Exception as exc:
+                failures += 1
+                print(f"❌ {path}: {exc}", file=sys.stderr)
+
+    # Deterministic output order regardless of completion order
+    summaries.sort(key=lambda r: r["file"])
+    if args.fmt == "csv":
+        write_results_csv(summaries, args.out_dir)
+    write_timing_summary(summaries, args.out_dir, time.perf_counter() - t0)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
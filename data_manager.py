@@ -1,15 +1,109 @@
 # data_manager.py
+import re
+from array import array
 
-def parse_edge_list(file_content_str: str):
+import numpy as np
+
+
+class IntEdgeList:
+    """
+    Edge list for integer node ids, stored as two parallel int64 arrays.
+    Behaves like the usual list of (u, v) tuples (len / iteration / indexing),
+    so every algorithm and view can consume it unchanged.
+    """
+    __slots__ = ("src", "dst")
+
+    def __init__(self, src, dst):
+        self.src = src
+        self.dst = dst
+
+    def __len__(self):
+        return len(self.src)
+
+    def __iter__(self):
+        return zip(self.src, self.dst)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return IntEdgeList(self.src[i], self.dst[i])
+        return (self.src[i], self.dst[i])
+
+
+def _is_int_token(token):
+    """Canonical integers only ("7", "-3"); "007" or "+7" stay strings to avoid merging labels."""
+    digits = token[1:] if token.startswith("-") else token
+    return digits.isdigit() and (digits == "0" or not digits.startswith("0")) and token != "-0"
+
+
+# A whole file of exactly two canonical int64 ids per line (blank lines allowed).
+# ASCII-only digits, at most 18 of them, so numpy can parse it without overflow.
+_INT_TOKEN = r"(?:0|-?[1-9][0-9]{0,17})"
+_INT_EDGE_FILE = re.compile(
+    rf"(?:[ \t]*{_INT_TOKEN}[ \t]+{_INT_TOKEN}[ \t]*(?:\r?\n|\Z)|[ \t]*\r?\n)*",
+    re.ASCII,
+)
+
+
+def _to_int_array(values):
+    """numpy int64 array -> array('q') (single memcpy)."""
+    out = array('q')
+    out.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return out
+
+
+def _parse_int_edges(text):
+    """
+    Parses integer edges straight into int64 arrays (no per-edge string tuples kept).
+    Plain two-column files are parsed in one numpy call; anything else (extra
+    columns, one-token lines) goes line by line with one int() per token.
+    Returns None as soon as a non-integer label is found.
+    """
+    if _INT_EDGE_FILE.fullmatch(text):
+        values = np.fromstring(text, dtype=np.int64, sep=" ")
+        src, dst = _to_int_array(values[0::2]), _to_int_array(values[1::2])
+    else:
+        src, dst = array('q'), array('q')
+        try:
+            for line in text.splitlines():
+                parts = line.split()
+                if len(parts) >= 2:
+                    u, v = parts[0], parts[1]
+                    iu, iv = int(u), int(v)
+                    # Canonical form only: "007", "+7", "-0", "1_0" stay strings
+                    if str(iu) != u or str(iv) != v:
+                        return None
+                    src.append(iu)
+                    dst.append(iv)
+        except (ValueError, OverflowError):
+            return None
+
+    # Numeric sort + dedup of all endpoints
+    nodes = _to_int_array(np.unique(np.concatenate((
+        np.frombuffer(src, dtype=np.int64), np.frombuffer(dst, dtype=np.int64)))))
+    return nodes, IntEdgeList(src, dst)
+
+
+def parse_edge_list(file_content_str: str, numeric_ids: bool = False):
     """
     Parses raw string content (from text area or file) into nodes and edges.
     Expected Format: "NodeA NodeB" per line.
+
+    numeric_ids=True: if every node label is an integer, returns
+    (array('q') of sorted unique ids, IntEdgeList) instead of strings,
+    giving numeric ordering (2 < 10) and arithmetic/bisect id lookups.
+    Falls back to the string result when any label is not an integer.
     """
     edges = []
     nodes = set()
     
     # Use splitlines() to handle different line endings (Windows/Linux) robustly
-    lines = file_content_str.strip().splitlines()
+    text = file_content_str.strip()
+    lines = text.splitlines()
+
+    if numeric_ids:
+        parsed = _parse_int_edges(text)
+        if parsed is not None and len(parsed[0]) > 0:
+            return parsed
     
     for line in lines:
         parts = line.strip().split()
@@ -26,3 +120,37 @@ def parse_edge_list(file_content_str: str):
                 
     # Return sorted nodes for consistent ordering in UI
     return sorted(list(nodes)), edges
+
+
+def iter_edge_file(path, numeric_ids=False):
+    """
+    Streams (u, v) pairs from an edge-list file line by line (same rules as
+    parse_edge_list), so edge sets larger than memory can be consumed lazily.
+    numeric_ids=True yields ints for canonical integer labels.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2:
+                u, v = parts[0], parts[1]
+                if numeric_ids and _is_int_token(u) and _is_int_token(v):
+                    yield int(u), int(v)
+                else:
+                    yield u, v
+
+
+def scan_node_table(path, numeric_ids=False):
+    """
+    First streaming pass over an edge-list file: returns only the sorted unique
+    node labels (O(V) memory), for use with a second pass of iter_edge_file.
+    Falls back to string labels if any label is not an integer; stream the
+    edges with numeric_ids=isinstance(nodes, array) to match.
+    """
+    nodes = set()
+    for u, v in iter_edge_file(path, numeric_ids):
+        nodes.add(u)
+        nodes.add(v)
+    if numeric_ids and nodes and all(isinstance(node, int) for node in nodes):
+        return array('q', sorted(nodes))
+    # Same label may arrive as int and str ("7" in "7 8" and "7 a"): dedup after str()
+    return sorted({str(node) for node in nodes})
@@ -1,14 +1,36 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import deque
 
 # ============================================================
 # [Helper Functions] Data Structure Constraints
 # ============================================================
 
+def _is_int_node_array(nodes):
+    """True for the sorted, deduplicated integer id array from parse_edge_list(numeric_ids=True)."""
+    return isinstance(nodes, array) and nodes.typecode == 'q'
+
+def _dense_int_index(sorted_arr, target):
+    """
+    [Integer Fast Path] If ids form a contiguous range (e.g. 0..N-1), the index
+    is pure arithmetic: target - first id. Returns None when not applicable.
+    """
+    if not _is_int_node_array(sorted_arr) or not sorted_arr or not isinstance(target, int):
+        return None
+    base = sorted_arr[0]
+    if sorted_arr[-1] - base + 1 != len(sorted_arr):
+        return None
+    idx = target - base
+    return idx if 0 <= idx < len(sorted_arr) else -1
+
 def _binary_search(sorted_arr, target):
     """
     [Constraint] Use Binary Search (O(log N)) instead of Dictionary/Hash.
     Returns index of target, or -1 if not found.
     """
+    dense_idx = _dense_int_index(sorted_arr, target)
+    if dense_idx is not None:
+        return dense_idx
     left, right = 0, len(sorted_arr) - 1
     while left <= right:
         mid = (left + right) // 2
@@ -25,6 +47,9 @@ def _create_mapping_list(nodes):
     Sort and Deduplicate node names.
     Uses Selection Sort to strictly avoid Python's sort() or set if required.
     """
+    # Integer ids arrive already sorted (numerically) and unique
+    if _is_int_node_array(nodes):
+        return nodes
     unique_nodes = []
     for node in nodes:
         exists = False
@@ -79,22 +104,329 @@ def _build_adj_list_indices_no_dict(n, edges, sorted_nodes, is_directed, reverse
                 neighbors[i], neighbors[min_idx] = neighbors[min_idx], neighbors[i]
     return adj
 
+FAST_PATH_MIN_NODES = 1000 # Above this, _prepare_graph switches to the Large-Graph Fast Path builders
+
+def _prepare_graph(nodes, edges, is_directed, graph=None, reverse=False):
+    """
+    Returns (node_map, adj). With a shared store graph (graph_store.SharedGraph),
+    both come from its read-only cache instead of being rebuilt per simulation.
+    """
+    if graph is not None:
+        return graph.node_map, graph.adjacency(is_directed, reverse)
+    if len(nodes) > FAST_PATH_MIN_NODES:
+        # Selection sort + list scans are O(V^2); the sort-based builders give the same order
+        node_map = _sorted_unique(nodes)
+        offsets, targets = _build_csr(len(node_map), edges, node_map, is_directed, reverse)
+        return node_map, [targets[offsets[u]:offsets[u + 1]] for u in range(len(node_map))]
+    node_map = _create_mapping_list(nodes)
+    return node_map, _build_adj_list_indices_no_dict(len(node_map), edges, node_map, is_directed, reverse)
+
+# ============================================================
+# [Helper Functions] Large-Graph Fast Path
+# ============================================================
+
+def _sorted_unique(nodes):
+    """
+    O(N log N) replacement for _create_mapping_list on large graphs.
+    Sorts once, then deduplicates with a single linear pass (no set).
+    """
+    if _is_int_node_array(nodes):
+        return nodes
+    unique = []
+    for node in sorted(nodes):
+        if not unique or unique[-1] != node:
+            unique.append(node)
+    return unique
+
+def _lookup_index(sorted_arr, target):
+    """
+    Same contract as _binary_search, but backed by bisect (C implementation).
+    Returns index of target, or -1 if not found.
+    """
+    dense_idx = _dense_int_index(sorted_arr, target)
+    if dense_idx is not None:
+        return dense_idx
+    i = bisect_left(sorted_arr, target)
+    if i < len(sorted_arr) and sorted_arr[i] == target:
+        return i
+    return -1
+
+def _build_csr(n, edges, sorted_nodes, is_directed, reverse=False):
+    """
+    Build a Compressed Sparse Row adjacency using two flat int64 arrays.
+    Neighbors of u are targets[offsets[u]:offsets[u + 1]].
+    Same neighbor sets and order as _build_adj_list_indices_no_dict (sorted,
+    no duplicates), so every engine sees one traversal order whichever
+    builder produced the graph. One C sort over packed (src, dst) keys.
+    reverse=True: Builds Transpose Graph.
+    """
+    keys = array('q')
+    for u, v in edges:
+        u_idx = _lookup_index(sorted_nodes, u)
+        v_idx = _lookup_index(sorted_nodes, v)
+        if u_idx == -1 or v_idx == -1:
+            continue
+        src, dst = (v_idx, u_idx) if reverse else (u_idx, v_idx)
+        keys.append(src * n + dst)
+        if not is_directed and not reverse:
+            keys.append(dst * n + src)
+
+    offsets = array('q', [0]) * (n + 1)
+    targets = array('q')
+    last = -1
+    for key in sorted(keys):
+        if key == last: continue
+        last = key
+        src, dst = divmod(key, n)
+        offsets[src + 1] += 1
+        targets.append(dst)
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    return offsets, targets
+
+def _adjacency_offsets(adj):
+    """Flat position of adj[u][0] for every u (CSR offsets, or prefix sums for list-of-lists)."""
+    if hasattr(adj, "offsets"):
+        return adj.offsets
+    offsets = array('q', [0]) * (len(adj) + 1)
+    for u in range(len(adj)):
+        offsets[u + 1] = offsets[u] + len(adj[u])
+    return offsets
+
+def _search_sequence(n, start_idx):
+    """Traversal roots: the user-selected node first, then every other index."""
+    sequence = [start_idx] if start_idx != -1 else []
+    for i in range(n):
+        if i != start_idx: sequence.append(i)
+    return sequence
+
+def _kosaraju_scc_ids(n, offsets, targets, r_offsets, r_targets, search_sequence):
+    """
+    Iterative Kosaraju (no recursion limit) over CSR arrays.
+    Returns (scc_ids, scc_count). SCC ids come out in topological order of the
+    condensation: id 0 has no incoming edges from other components.
+    """
+    # Phase 1: finishing order on the original graph
+    colors = [0] * n
+    finish_order = []
+    for root in search_sequence:
+        if colors[root]: continue
+        colors[root] = 1
+        stack, iters = [root], [offsets[root]]
+        while stack:
+            u, i = stack[-1], iters[-1]
+            if i < offsets[u + 1]:
+                iters[-1] = i + 1
+                v = targets[i]
+                if not colors[v]:
+                    colors[v] = 1
+                    stack.append(v); iters.append(offsets[v])
+            else:
+                stack.pop(); iters.pop()
+                finish_order.append(u)
+
+    # Phase 2: reverse finishing order on the transpose graph
+    scc_ids = [-1] * n
+    scc_count = 0
+    for root in reversed(finish_order):
+        if scc_ids[root] != -1: continue
+        scc_ids[root] = scc_count
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for i in range(r_offsets[u], r_offsets[u + 1]):
+                v = r_targets[i]
+                if scc_ids[v] == -1:
+                    scc_ids[v] = scc_count
+                    stack.append(v)
+        scc_count += 1
+    return scc_ids, scc_count
+
+def _group_by_id(ids, count):
+    """Counting sort of indices by id -> (group_offsets, members)."""
+    group_offsets = [0] * (count + 1)
+    for g in ids:
+        group_offsets[g + 1] += 1
+    for g in range(count):
+        group_offsets[g + 1] += group_offsets[g]
+    members = [0] * len(ids)
+    fill = group_offsets[:-1]
+    for u, g in enumerate(ids):
+        members[fill[g]] = u
+        fill[g] += 1
+    return group_offsets, members
+
+def _build_condensation_csr(offsets, targets, scc_ids, scc_count):
+    """
+    Collapse each SCC into a super-node. Inter-component edges are deduplicated
+    with a 'last seen' marker array instead of a set, keeping this O(V + E).
+    """
+    group_offsets, members = _group_by_id(scc_ids, scc_count)
+    dag_offsets = [0] * (scc_count + 1)
+    dag_targets = []
+    marker = [-1] * scc_count
+    for c in range(scc_count):
+        marker[c] = c # Skip self loops
+        for k in range(group_offsets[c], group_offsets[c + 1]):
+            u = members[k]
+            for i in range(offsets[u], offsets[u + 1]):
+                d = scc_ids[targets[i]]
+                if marker[d] != c:
+                    marker[d] = c
+                    dag_targets.append(d)
+        dag_offsets[c + 1] = len(dag_targets)
+    return dag_offsets, dag_targets, group_offsets, members
+
+def _kahn_levels(count, dag_offsets, dag_targets):
+    """
+    Kahn's algorithm on a DAG in CSR form.
+    Returns (topo_order, levels) where level = longest path length from a source.
+    """
+    indegree = [0] * count
+    for d in dag_targets:
+        indegree[d] += 1
+    levels = [0] * count
+    queue = deque(c for c in range(count) if indegree[c] == 0)
+    topo_order = []
+    while queue:
+        c = queue.popleft()
+        topo_order.append(c)
+        for i in range(dag_offsets[c], dag_offsets[c + 1]):
+            d = dag_targets[i]
+            if levels[c] + 1 > levels[d]:
+                levels[d] = levels[c] + 1
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                queue.append(d)
+    return topo_order, levels
+
+# ============================================================
+# [Helper Functions] Step Granularity (Trace Size Budget)
+# ============================================================
+# Finest -> coarsest. "level" = per BFS level / per DFS tree.
+GRANULARITY_LEVELS = ["edge", "node", "level", "component"]
+DEFAULT_STEP_BUDGET = 5000
+DEFAULT_MEMORY_BUDGET_MB = 256
+SNAPSHOT_BYTES_PER_NODE = 160 # Rough cost of one node across visited/order/levels/structure in a snapshot
+SNAPSHOT_BYTES_PER_EDGE_TYPE = 64 # Rough cost of one edge_types entry (copied into every snapshot)
+
+class TraceBudgetError(ValueError):
+    """granularity="auto": not even the final snapshot fits the memory budget."""
+
+def _traversal_profile(n, adj, search_sequence):
+    """
+    Result-only BFS pre-pass (no snapshots, O(V + E)).
+    Returns (component_count, level_count) where level_count sums the BFS
+    levels of every component. Component roots match the BFS/DFS forests.
+    """
+    seen = [False] * n
+    dist = [0] * n
+    comp_count = 0
+    level_count = 0
+    for root in search_sequence:
+        if seen[root]: continue
+        comp_count += 1
+        seen[root] = True
+        dist[root] = 0
+        deepest = 0
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            if dist[u] > deepest: deepest = dist[u]
+            for v in adj[u]:
+                if not seen[v]:
+                    seen[v] = True
+                    dist[v] = dist[u] + 1
+                    queue.append(v)
+        level_count += deepest + 1
+    return comp_count, level_count
+
+def estimate_trace_steps(n, adj_entries, comp_count, level_count, algo_style="BFS"):
+    """
+    Step count per granularity (exact for BFS, upper bound for DFS edge mode).
+    adj_entries = total adjacency list length (E directed, 2E undirected).
+    """
+    if algo_style == "BFS":
+        return {
+            "edge": 2 * n + 1,                       # start + visit + discover
+            "node": comp_count + n + 1,              # start + visit
+            "level": comp_count + level_count + 1,   # start + level boundary
+            "component": comp_count + 1,             # component done
+        }
+    return {
+        "edge": comp_count + 2 * n + adj_entries + 1, # start + tree/back/cross + finish
+        "node": comp_count + n + 1,                   # start + finish
+        "level": 2 * comp_count + 1,                  # tree start + tree finish
+        "component": comp_count + 1,                  # tree finish
+    }
+
+def choose_granularity(step_estimates, n, step_budget=DEFAULT_STEP_BUDGET, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+                       edge_type_entries=0):
+    """
+    Finest granularity whose trace fits both budgets, as (granularity, stride).
+    A full snapshot costs ~ n * bytes per node + edge_types entries * bytes per entry;
+    snapshots grow with the traversal, so a trace costs ~ steps * full / 2.
+    When even one step per component is too much, components are coalesced:
+    ("component", stride) emits one step every `stride` components.
+    Raises TraceBudgetError when not even the final snapshot fits.
+    """
+    memory_budget = memory_budget_mb * 1024 * 1024
+    full_bytes = max(n, 1) * SNAPSHOT_BYTES_PER_NODE + edge_type_entries * SNAPSHOT_BYTES_PER_EDGE_TYPE
+    for level in GRANULARITY_LEVELS:
+        est_steps = step_estimates[level]
+        if est_steps <= step_budget and est_steps * full_bytes // 2 <= memory_budget:
+            return level, 1
+
+    if full_bytes > memory_budget:
+        raise TraceBudgetError(
+            f"One snapshot needs ~{full_bytes / 2**20:.0f} MB, over the {memory_budget_mb} MB memory budget. "
+            f"Raise the budget or use the result-only engines (compute_bfs / compute_dfs, CLI --mode result).")
+    # Component steps that fit next to the (always emitted) final snapshot
+    comp_count = step_estimates["component"] - 1
+    max_steps = min(step_budget, 2 * memory_budget // full_bytes) - 1
+    if max_steps < 1:
+        return "component", comp_count + 1 # Final snapshot only
+    return "component", -(-comp_count // max_steps)
+
+def _resolve_granularity(granularity, algo_style, n, adj, search_sequence, step_budget, memory_budget_mb):
+    """Returns (granularity, stride); stride > 1 only when "auto" has to coalesce components."""
+    if granularity != "auto":
+        if granularity not in GRANULARITY_LEVELS:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        return granularity, 1
+    comp_count, level_count = _traversal_profile(n, adj, search_sequence)
+    adj_entries = sum(len(neighbors) for neighbors in adj)
+    estimates = estimate_trace_steps(n, adj_entries, comp_count, level_count, algo_style)
+    # BFS only records tree edges; DFS classifies (almost) every adjacency entry
+    edge_type_entries = n if algo_style == "BFS" else adj_entries
+    return choose_granularity(estimates, n, step_budget, memory_budget_mb, edge_type_entries)
+
+def _granularity_note(granularity, stride=1):
+    if stride > 1:
+        return f" [Granularity: {granularity}, 1 step per {stride} components]"
+    return "" if granularity == "edge" else f" [Granularity: {granularity}]"
+
 # ============================================================
 # 1. BFS Implementation
 # ============================================================
-def run_bfs_simulation(nodes, edges, start_node, is_directed=False):
-    sorted_nodes_map = _create_mapping_list(nodes)
+def run_bfs_simulation(nodes, edges, start_node, is_directed=False, steps=None, granularity="edge",
+                       step_budget=DEFAULT_STEP_BUDGET, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, graph=None):
+    """
+    granularity: "edge" (every discovery), "node" (every visit), "level" (every BFS level),
+    "component" (every finished component) or "auto" (finest fitting the budgets).
+    Skipped steps are never built, so coarse modes also bound generation time.
+    """
+    sorted_nodes_map, adj = _prepare_graph(nodes, edges, is_directed, graph)
     n = len(sorted_nodes_map)
     start_idx = _binary_search(sorted_nodes_map, start_node)
-    adj = _build_adj_list_indices_no_dict(n, edges, sorted_nodes_map, is_directed)
 
     visited = [False] * n
     levels = [-1] * n
     queue = deque()
-    steps = []
+    steps = [] if steps is None else steps # Optional sink (e.g. background worker buffer)
     comp_count = 0
     global_visit_order = [] 
-    edge_types_list = [] # For tracking Tree Edges in BFS
+    edge_types = {} # Tree Edges in discovery order
 
     # Reorder search sequence to start with the user-selected node
     search_sequence = []
@@ -102,22 +434,33 @@ def run_bfs_simulation(nodes, edges, start_node, is_directed=False):
     for i in range(n):
         if i != start_idx: search_sequence.append(i)
 
+    granularity, stride = _resolve_granularity(granularity, "BFS", n, adj, search_sequence, step_budget, memory_budget_mb)
+    emit_edges = granularity == "edge"
+    emit_nodes = granularity in ("edge", "node")
+
     for root in search_sequence:
         if visited[root]: continue
         comp_count += 1
         visited[root] = True
         levels[root] = 0
         queue.append(root)
+        current_level = -1
 
-        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [], levels, edge_types_list, comp_count, 
-                                    f"🚀 Start Component #{comp_count} (Root: {sorted_nodes_map[root]})", algo_style="BFS"))
+        if granularity != "component":
+            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [], levels, edge_types, comp_count, 
+                                        f"🚀 Start Component #{comp_count} (Root: {sorted_nodes_map[root]})", algo_style="BFS"))
 
         while queue:
             curr = queue.popleft()
-            if curr not in global_visit_order: global_visit_order.append(curr)
+            global_visit_order.append(curr) # Each node is dequeued exactly once
             
-            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [], levels, edge_types_list, comp_count,
-                                        f"📍 Visit: {sorted_nodes_map[curr]} (L{levels[curr]})", algo_style="BFS"))
+            if emit_nodes:
+                steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [], levels, edge_types, comp_count,
+                                            f"📍 Visit: {sorted_nodes_map[curr]} (L{levels[curr]})", algo_style="BFS"))
+            elif granularity == "level" and levels[curr] != current_level:
+                current_level = levels[curr]
+                steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [], levels, edge_types, comp_count,
+                                            f"📶 Level L{current_level}: Visiting from {sorted_nodes_map[curr]} ({len(queue) + 1} in frontier)", algo_style="BFS"))
 
             for neighbor in adj[curr]:
                 if not visited[neighbor]:
@@ -127,31 +470,43 @@ def run_bfs_simulation(nodes, edges, start_node, is_directed=False):
                     # Record Tree Edge
                     u_str, v_str = sorted_nodes_map[curr], sorted_nodes_map[neighbor]
                     ekey = (u_str, v_str) if is_directed else (tuple(sorted((u_str, v_str))))
-                    edge_types_list.append((ekey, "tree"))
+                    edge_types[ekey] = "tree"
                     
                     queue.append(neighbor)
-                    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [(curr, neighbor)], levels, edge_types_list, comp_count,
-                                                f"  🔎 Discovered (Tree Edge): {sorted_nodes_map[neighbor]} -> Queue", algo_style="BFS"))
+                    if emit_edges:
+                        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, list(queue), [(curr, neighbor)], levels, edge_types, comp_count,
+                                                    f"  🔎 Discovered (Tree Edge): {sorted_nodes_map[neighbor]} -> Queue", algo_style="BFS"))
+
+        if granularity == "component" and comp_count % stride == 0:
+            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, [], [], levels, edge_types, comp_count,
+                                        f"📦 Component #{comp_count} Done (Root: {sorted_nodes_map[root]})", algo_style="BFS"))
     
-    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, [], [], levels, edge_types_list, comp_count, 
-                                        f"✅ BFS Traversal Complete. (Total Components: {comp_count})", algo_style="BFS"))
+    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, visited, global_visit_order, [], [], levels, edge_types, comp_count, 
+                                        f"✅ BFS Traversal Complete. (Total Components: {comp_count}){_granularity_note(granularity, stride)}", algo_style="BFS"))
     return steps
 
 # ============================================================
 # 2. DFS Implementation
 # ============================================================
-def run_dfs_simulation(nodes, edges, start_node, is_directed=False):
-    sorted_nodes_map = _create_mapping_list(nodes)
+def run_dfs_simulation(nodes, edges, start_node, is_directed=False, steps=None, granularity="edge",
+                       step_budget=DEFAULT_STEP_BUDGET, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, graph=None):
+    """
+    granularity: "edge" (tree/back/cross edges + finishes), "node" (every finish),
+    "level" (every DFS tree start/finish), "component" (every finished tree) or "auto".
+    """
+    sorted_nodes_map, adj = _prepare_graph(nodes, edges, is_directed, graph)
     n = len(sorted_nodes_map)
     start_idx = _binary_search(sorted_nodes_map, start_node)
-    adj = _build_adj_list_indices_no_dict(n, edges, sorted_nodes_map, is_directed)
 
     colors = [0] * n 
     depths = [-1] * n
-    steps = []
+    steps = [] if steps is None else steps
     comp_count = 0
     global_visit_order = []
-    edge_types_list = [] 
+    edge_types = {} # Classified edges in discovery order (snapshot view)
+    # Per adjacency-position classification (0 = unclassified): O(1) "already typed?" check
+    adj_offsets = _adjacency_offsets(adj)
+    classified = bytearray(adj_offsets[n])
 
     # Reorder search sequence
     search_sequence = []
@@ -159,6 +514,10 @@ def run_dfs_simulation(nodes, edges, start_node, is_directed=False):
     for i in range(n):
         if i != start_idx: search_sequence.append(i)
 
+    granularity, stride = _resolve_granularity(granularity, "DFS", n, adj, search_sequence, step_budget, memory_budget_mb)
+    emit_edges = granularity == "edge"
+    emit_nodes = granularity in ("edge", "node")
+
     for root in search_sequence:
         if colors[root] != 0: continue
         comp_count += 1
@@ -167,8 +526,9 @@ def run_dfs_simulation(nodes, edges, start_node, is_directed=False):
         global_visit_order.append(root)
         depths[root] = 0
         
-        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [], depths, edge_types_list, comp_count,
-                                        f"🚀 Start Component #{comp_count} (Root: {sorted_nodes_map[root]})", algo_style="DFS"))
+        if granularity != "component":
+            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [], depths, edge_types, comp_count,
+                                            f"🚀 Start Component #{comp_count} (Root: {sorted_nodes_map[root]})", algo_style="DFS"))
       
         while stack:
             u, iter_idx, d = stack[-1]
@@ -176,59 +536,68 @@ def run_dfs_simulation(nodes, edges, start_node, is_directed=False):
 
             if iter_idx < len(neighbors):
                 v = neighbors[iter_idx]
+                pos = adj_offsets[u] + iter_idx
                 stack[-1][1] += 1
                 
                 u_str, v_str = sorted_nodes_map[u], sorted_nodes_map[v]
                 ekey = (u_str, v_str) if is_directed else (tuple(sorted((u_str, v_str))))
-                existing_type = None
-                for k, t in edge_types_list:
-                    if k == ekey: existing_type = t; break
+                # Undirected twin entry (v -> u) is either the parent edge or reaches a finished node
+                already_typed = classified[pos] != 0
 
                 if colors[v] == 0: # Tree Edge
-                    edge_types_list.append((ekey, "tree"))
+                    classified[pos] = 1
+                    edge_types[ekey] = "tree"
                     colors[v] = 1 
                     depths[v] = d + 1
                     global_visit_order.append(v)
                     stack.append([v, 0, d + 1])
-                    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types_list, comp_count,
-                                                    f"  Tree Edge: {u_str}->{v_str}", algo_style="DFS"))
+                    if emit_edges:
+                        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types, comp_count,
+                                                        f"  Tree Edge: {u_str}->{v_str}", algo_style="DFS"))
                 elif colors[v] == 1: # Back Edge
                     is_parent = (not is_directed and len(stack) >= 2 and stack[-2][0] == v)
-                    if not is_parent and existing_type is None:
-                        edge_types_list.append((ekey, "back"))
-                        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types_list, comp_count,
-                                                        f"  🔄 Back Edge: {u_str}->{v_str}", algo_style="DFS"))
+                    if not is_parent and not already_typed:
+                        classified[pos] = 2
+                        edge_types[ekey] = "back"
+                        if emit_edges:
+                            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types, comp_count,
+                                                            f"  🔄 Back Edge: {u_str}->{v_str}", algo_style="DFS"))
                 elif colors[v] == 2: # Cross/Forward
-                    if is_directed and existing_type is None:
-                        edge_types_list.append((ekey, "cross"))
-                        steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types_list, comp_count,
-                                                        f"  Cross/Forward: {u_str}->{v_str}", algo_style="DFS"))
+                    if is_directed and not already_typed:
+                        classified[pos] = 3
+                        edge_types[ekey] = "cross"
+                        if emit_edges:
+                            steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [(u, v)], depths, edge_types, comp_count,
+                                                            f"  Cross/Forward: {u_str}->{v_str}", algo_style="DFS"))
             else:
                 stack.pop()
                 colors[u] = 2
-                steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [], depths, edge_types_list, comp_count,
-                                                f"🔙 Backtrack: Finished {sorted_nodes_map[u]}", algo_style="DFS"))
+                if emit_nodes:
+                    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [], depths, edge_types, comp_count,
+                                                    f"🔙 Backtrack: Finished {sorted_nodes_map[u]}", algo_style="DFS"))
+                elif not stack and comp_count % stride == 0: # Root finished -> whole DFS tree done
+                    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, stack, [], depths, edge_types, comp_count,
+                                                    f"🌲 DFS Tree #{comp_count} Finished (Root: {sorted_nodes_map[u]})", algo_style="DFS"))
 
-    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, [], [], depths, edge_types_list, comp_count, 
-                                        f"✅ DFS Traversal Complete. (Total Components: {comp_count})", algo_style="DFS"))
+    steps.append(_make_snapshot_bfs_dfs(sorted_nodes_map, colors, global_visit_order, [], [], depths, edge_types, comp_count, 
+                                        f"✅ DFS Traversal Complete. (Total Components: {comp_count}){_granularity_note(granularity, stride)}", algo_style="DFS"))
     return steps
 
 # ============================================================
 # 3. Topological Sort (DFS-based)
 # ============================================================
-def run_topological_sort_simulation(nodes, edges, start_node=None, is_directed=True):
-    node_map = _create_mapping_list(nodes)
+def run_topological_sort_simulation(nodes, edges, start_node=None, is_directed=True, steps=None, graph=None):
+    node_map, adj = _prepare_graph(nodes, edges, is_directed, graph)
     n = len(node_map)
-    adj = _build_adj_list_indices_no_dict(n, edges, node_map, is_directed)
 
     visited = [0] * n 
     stack = []         
-    steps = []         
+    steps = [] if steps is None else steps
     global_visit_order = [] 
     comp_count = 0     
 
     # Reorder search sequence
-    start_idx = _binary_search(node_map, start_node) if start_node else -1
+    start_idx = _binary_search(node_map, start_node) if start_node is not None else -1
     search_sequence = []
     if start_idx != -1: search_sequence.append(start_idx)
     for i in range(n):
@@ -306,17 +675,16 @@ def run_topological_sort_simulation(nodes, edges, start_node=None, is_directed=T
 # ============================================================
 # 4. SCC (Kosaraju's Algorithm)
 # ============================================================
-def run_scc_kosaraju_ui(nodes, edges, start_node=None, is_directed=True):
-    steps = []
-    node_map = _create_mapping_list(nodes)
-    n = len(node_map)
+def run_scc_kosaraju_ui(nodes, edges, start_node=None, is_directed=True, steps=None, graph=None):
+    steps = [] if steps is None else steps
 
     # Build Standard Adj and Transpose (Reverse) Adj
-    adj  = _build_adj_list_indices_no_dict(n, edges, node_map, is_directed, reverse=False)
-    radj = _build_adj_list_indices_no_dict(n, edges, node_map, is_directed, reverse=True)
+    node_map, adj = _prepare_graph(nodes, edges, is_directed, graph, reverse=False)
+    _, radj       = _prepare_graph(nodes, edges, is_directed, graph, reverse=True)
+    n = len(node_map)
 
     # Reorder search sequence
-    start_idx = _binary_search(node_map, start_node) if start_node else -1
+    start_idx = _binary_search(node_map, start_node) if start_node is not None else -1
     search_sequence = []
     if start_idx != -1: search_sequence.append(start_idx)
     for i in range(n):
@@ -399,15 +767,660 @@ def run_scc_kosaraju_ui(nodes, edges, start_node=None, is_directed=True):
 
     return steps
 
+# ============================================================
+# 5. SCC Condensation DAG (Component-level Topological Order)
+# ============================================================
+def _directed_csr_pair(nodes, edges, graph=None):
+    """(node_map, offsets, targets, r_offsets, r_targets) for the directed graph and its transpose."""
+    if graph is not None: # Reuse the shared store's CSR arrays
+        fwd, rev = graph.adjacency(True), graph.adjacency(True, reverse=True)
+        return graph.node_map, fwd.offsets, fwd.targets, rev.offsets, rev.targets
+    node_map = _sorted_unique(nodes)
+    n = len(node_map)
+    offsets, targets = _build_csr(n, edges, node_map, True)
+    r_offsets, r_targets = _build_csr(n, edges, node_map, True, reverse=True)
+    return node_map, offsets, targets, r_offsets, r_targets
+
+def compute_condensation(nodes, edges, start_node=None, graph=None):
+    """
+    Result-only pipeline for large directed graphs (works even with cycles).
+    SCC ids (iterative Kosaraju) -> deduplicated condensation DAG -> Kahn order/levels.
+    Runs in O(V log V + E log V) total, one pass per stage, no step snapshots.
+    """
+    node_map, offsets, targets, r_offsets, r_targets = _directed_csr_pair(nodes, edges, graph)
+    n = len(node_map)
+
+    start_idx = _lookup_index(node_map, start_node) if start_node is not None else -1
+    scc_ids, scc_count = _kosaraju_scc_ids(n, offsets, targets, r_offsets, r_targets,
+                                           _search_sequence(n, start_idx))
+    dag_offsets, dag_targets, group_offsets, members = _build_condensation_csr(offsets, targets, scc_ids, scc_count)
+    topo_order, levels = _kahn_levels(scc_count, dag_offsets, dag_targets)
+
+    return {
+        "node_map": node_map,
+        "scc_ids": scc_ids,
+        "components": [[node_map[members[k]] for k in range(group_offsets[c], group_offsets[c + 1])]
+                       for c in range(scc_count)],
+        "dag_edges": [(c, dag_targets[i]) for c in range(scc_count)
+                      for i in range(dag_offsets[c], dag_offsets[c + 1])],
+        "topo_order": topo_order,
+        "levels": levels,
+    }
+
+def _condensation_view(result):
+    """Static view data (super-node labels, DAG edges, members), shared by reference across snapshots."""
+    components = result["components"]
+    labels = [f"C{c}" for c in range(len(components))]
+    return {
+        "dag_nodes": labels,
+        "dag_edges": [(labels[c], labels[d]) for c, d in result["dag_edges"]],
+        "dag_members": {labels[c]: components[c] for c in range(len(components))},
+    }
+
+def compute_condensation_snapshot(nodes, edges, start_node=None, is_directed=True, graph=None):
+    """
+    Final snapshot of run_condensation_simulation, built straight from
+    compute_condensation (Kahn's order there is the order the trace replays).
+    """
+    result = compute_condensation(nodes, edges, start_node, graph)
+    view = _condensation_view(result)
+    labels, levels = view["dag_nodes"], result["levels"]
+    count = len(labels)
+    order = [labels[c] for c in result["topo_order"]]
+    return _make_snapshot_dag(view, order, [], [], {labels[c]: levels[c] for c in range(count)}, count,
+                              f"✅ Condensation Order Complete. ({count} Components, {max(levels) + 1 if levels else 0} Levels)")
+
+def run_condensation_simulation(nodes, edges, start_node=None, is_directed=True, steps=None, graph=None):
+    """
+    Step trace over the condensation DAG: each SCC becomes super-node 'C{id}',
+    then Kahn's algorithm emits the component-level topological order and levels.
+    """
+    steps = [] if steps is None else steps
+    result = compute_condensation(nodes, edges, start_node, graph)
+    components = result["components"]
+    count = len(components)
+    view = _condensation_view(result)
+    labels, dag_edges = view["dag_nodes"], view["dag_edges"]
+
+    steps.append(_make_snapshot_dag(view, [], [], [], {}, count,
+                                    f"🧩 Phase 1: Found {count} SCCs (each collapsed into a super-node)"))
+    steps.append(_make_snapshot_dag(view, [], [], [], {}, count,
+                                    f"🔗 Phase 2: Condensation DAG built ({count} nodes, {len(dag_edges)} deduplicated edges)"))
+
+    # Phase 3: Kahn's algorithm replay (levels follow the final longest-path levels)
+    adj = [[] for _ in range(count)]
+    indegree = [0] * count
+    for c, d in result["dag_edges"]:
+        adj[c].append(d)
+        indegree[d] += 1
+    levels = result["levels"]
+
+    queue = deque(c for c in range(count) if indegree[c] == 0)
+    order = [] # Popped labels, grown in place (snapshots take one C-level copy)
+    # Levels are the final longest-path levels, so one read-only dict is shared by
+    # every Phase 3 snapshot; the UI only labels components that were already popped.
+    level_view = {labels[c]: levels[c] for c in range(count)}
+    steps.append(_make_snapshot_dag(view, order, queue, [], level_view, count,
+                                    f"📥 Phase 3: Enqueue sources (in-degree 0): {[labels[c] for c in queue]}"))
+    while queue:
+        c = queue.popleft()
+        order.append(labels[c])
+        steps.append(_make_snapshot_dag(view, order, queue, [], level_view, count,
+                                        f"🔽 Pop: {labels[c]} (Rank {len(order)}, L{levels[c]}) {components[c]}"))
+        for d in adj[c]:
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                queue.append(d)
+                steps.append(_make_snapshot_dag(view, order, queue, [(c, d)], level_view, count,
+                                                f"  ➕ {labels[d]} in-degree 0 -> Queue"))
+
+    steps.append(_make_snapshot_dag(view, order, [], [], level_view, count,
+                                    f"✅ Condensation Order Complete. ({count} Components, {max(levels) + 1 if levels else 0} Levels)"))
+    return steps
+
+# ============================================================
+# 6. Union-Find Components (Undirected / Weakly Connected)
+# ============================================================
+def compute_components_union_find(nodes, edges):
+    """
+    Disjoint Set Union with path compression + union by rank, stored in flat arrays.
+    `edges` may be any iterable of (u, v) pairs (list, IntEdgeList, or a generator
+    such as data_manager.iter_edge_file) and is consumed in a single streaming pass:
+    no adjacency list is built, memory is O(V).
+    For directed input this yields weakly connected components.
+    """
+    node_map = _sorted_unique(nodes)
+    n = len(node_map)
+    parent = array('q', range(n))
+    rank = array('b', [0]) * n # Rank <= log2(V) < 128
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root: # Path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    for u, v in edges:
+        u_idx = _lookup_index(node_map, u)
+        v_idx = _lookup_index(node_map, v)
+        if u_idx == -1 or v_idx == -1:
+            continue
+        ru, rv = find(u_idx), find(v_idx)
+        if ru == rv:
+            continue
+        # Union by rank
+        if rank[ru] < rank[rv]:
+            ru, rv = rv, ru
+        parent[rv] = ru
+        if rank[ru] == rank[rv]:
+            rank[ru] += 1
+
+    # Canonical ids in node order (component of node_map[0] is #0, ...)
+    root_to_id = array('q', [-1]) * n
+    component_ids = array('q', [0]) * n
+    sizes = array('q')
+    for i in range(n):
+        root = find(i)
+        if root_to_id[root] == -1:
+            root_to_id[root] = len(sizes)
+            sizes.append(0)
+        cid = root_to_id[root]
+        component_ids[i] = cid
+        sizes[cid] += 1
+
+    return {
+        "node_map": node_map,
+        "component_ids": component_ids,
+        "sizes": sizes,
+        "count": len(sizes),
+    }
+
+# ============================================================
+# 7. Bidirectional BFS (Point-to-Point Shortest Path)
+# ============================================================
+def _path_from_parents(meet, parent_s, parent_t):
+    """source -> ... -> meet -> ... -> target, as node indices."""
+    path = []
+    u = meet
+    while u != -1:
+        path.append(u)
+        u = parent_s[u]
+    path.reverse()
+    u = parent_t[meet]
+    while u != -1:
+        path.append(u)
+        u = parent_t[u]
+    return path
+
+def run_bidirectional_bfs_simulation(nodes, edges, start_node, target_node=None, is_directed=False, steps=None, graph=None):
+    """
+    Hop-count shortest path from start_node to target_node.
+    Two BFS frontiers grow level by level (always the smaller one); the target side
+    walks the transpose graph when directed. The search stops at the first level
+    where the frontiers meet, so only a fraction of the graph is touched.
+    """
+    steps = [] if steps is None else steps
+    node_map, adj = _prepare_graph(nodes, edges, is_directed, graph)
+    radj = _prepare_graph(nodes, edges, is_directed, graph, reverse=True)[1] if is_directed else adj
+    n = len(node_map)
+    s_idx = _binary_search(node_map, start_node)
+    t_idx = _binary_search(node_map, target_node) if target_node is not None else -1
+
+    dist_s, dist_t = [-1] * n, [-1] * n
+    parent_s, parent_t = [-1] * n, [-1] * n
+    touched = [] # Indices with any distance set (visit order)
+    view = {"node_map": node_map, "is_directed": is_directed, "dist_s": dist_s, "dist_t": dist_t, "touched": touched}
+
+    if s_idx == -1 or t_idx == -1:
+        steps.append(_make_snapshot_bidir(view, [], [], [], [], None, "❌ Source or Target node not found."))
+        return steps
+
+    dist_s[s_idx], dist_t[t_idx] = 0, 0
+    touched.append(s_idx)
+    if t_idx != s_idx: touched.append(t_idx)
+    frontier_s, frontier_t = [s_idx], [t_idx]
+    steps.append(_make_snapshot_bidir(view, frontier_s, frontier_t, [], [], None,
+                                      f"🚀 Start: {node_map[s_idx]} (S0) ⇄ {node_map[t_idx]} (T0)"))
+
+    best_meet, best_len = (s_idx, 0) if s_idx == t_idx else (-1, -1)
+    while best_meet == -1 and frontier_s and frontier_t:
+        # Expand the smaller frontier by one full level
+        forward = len(frontier_s) <= len(frontier_t)
+        frontier, graph_adj = (frontier_s, adj) if forward else (frontier_t, radj)
+        dist_mine, dist_other = (dist_s, dist_t) if forward else (dist_t, dist_s)
+        parent_mine = parent_s if forward else parent_t
+        side = "S" if forward else "T"
+        steps.append(_make_snapshot_bidir(view, frontier_s, frontier_t, [], [], None,
+                                          f"📶 Expand {'source' if forward else 'target'} frontier: {len(frontier)} node(s) at {side}{dist_mine[frontier[0]]}"))
+
+        next_frontier = []
+        for u in frontier:
+            for v in graph_adj[u]:
+                if dist_other[v] != -1: # Frontiers meet
+                    total = dist_mine[u] + 1 + dist_other[v]
+                    if best_meet == -1 or total < best_len:
+                        best_len = total
+                        # Meeting node is where both parent chains end
+                        # v is already touched (by the other side)
+                        if dist_mine[v] == -1:
+                            dist_mine[v] = dist_mine[u] + 1
+                            parent_mine[v] = u
+                            next_frontier.append(v)
+                        best_meet = v
+                        pair = (u, v) if forward else (v, u)
+                        steps.append(_make_snapshot_bidir(view, frontier_s, frontier_t, [pair], [], None,
+                                                          f"  🤝 Frontiers meet at {node_map[v]} (path length {total})"))
+                    continue
+                if dist_mine[v] == -1:
+                    dist_mine[v] = dist_mine[u] + 1
+                    parent_mine[v] = u
+                    touched.append(v)
+                    next_frontier.append(v)
+                    pair = (u, v) if forward else (v, u)
+                    steps.append(_make_snapshot_bidir(view, frontier_s if not forward else next_frontier,
+                                                      frontier_t if forward else next_frontier, [pair], [], None,
+                                                      f"  🔎 Discovered {node_map[v]} ({side}{dist_mine[v]})"))
+        if forward: frontier_s = next_frontier
+        else: frontier_t = next_frontier
+
+    if best_meet == -1:
+        steps.append(_make_snapshot_bidir(view, [], [], [], [], [],
+                                          f"⛔ No path from {node_map[s_idx]} to {node_map[t_idx]}. (Touched {len(touched)}/{n} nodes)"))
+        return steps
+
+    path = _path_from_parents(best_meet, parent_s, parent_t)
+    path_pairs = [(path[i], path[i + 1]) for i in range(len(path) - 1)]
+    steps.append(_make_snapshot_bidir(view, [], [], [], path_pairs, path,
+                                      f"✅ Shortest Path ({len(path) - 1} hops): {' → '.join(str(node_map[x]) for x in path)} "
+                                      f"(Touched {len(touched)}/{n} nodes)"))
+    return steps
+
+def shortest_path_bidirectional(nodes, edges, start_node, target_node, is_directed=False, graph=None):
+    """
+    Result-only version of run_bidirectional_bfs_simulation (no snapshots):
+    {"path": [labels] or None, "hops": int or None, "touched": int}.
+    """
+    node_map, adj = _prepare_graph(nodes, edges, is_directed, graph)
+    radj = _prepare_graph(nodes, edges, is_directed, graph, reverse=True)[1] if is_directed else adj
+    n = len(node_map)
+    s_idx = _binary_search(node_map, start_node)
+    t_idx = _binary_search(node_map, target_node) if target_node is not None else -1
+    if s_idx == -1 or t_idx == -1:
+        return {"path": None, "hops": None, "touched": 0}
+
+    dist_s, dist_t = [-1] * n, [-1] * n
+    parent_s, parent_t = [-1] * n, [-1] * n
+    dist_s[s_idx], dist_t[t_idx] = 0, 0
+    touched = 1 if s_idx == t_idx else 2
+    frontier_s, frontier_t = [s_idx], [t_idx]
+
+    best_meet, best_len = (s_idx, 0) if s_idx == t_idx else (-1, -1)
+    while best_meet == -1 and frontier_s and frontier_t:
+        forward = len(frontier_s) <= len(frontier_t)
+        frontier, graph_adj = (frontier_s, adj) if forward else (frontier_t, radj)
+        dist_mine, dist_other = (dist_s, dist_t) if forward else (dist_t, dist_s)
+        parent_mine = parent_s if forward else parent_t
+
+        next_frontier = []
+        for u in frontier:
+            for v in graph_adj[u]:
+                if dist_other[v] != -1:
+                    total = dist_mine[u] + 1 + dist_other[v]
+                    if best_meet == -1 or total < best_len:
+                        best_len = total
+                        if dist_mine[v] == -1:
+                            dist_mine[v] = dist_mine[u] + 1
+                            parent_mine[v] = u
+                        best_meet = v
+                    continue
+                if dist_mine[v] == -1:
+                    dist_mine[v] = dist_mine[u] + 1
+                    parent_mine[v] = u
+                    touched += 1
+                    next_frontier.append(v)
+        if forward: frontier_s = next_frontier
+        else: frontier_t = next_frontier
+
+    if best_meet == -1:
+        return {"path": None, "hops": None, "touched": touched}
+    path = [node_map[x] for x in _path_from_parents(best_meet, parent_s, parent_t)]
+    return {"path": path, "hops": len(path) - 1, "touched": touched}
+
+# ============================================================
+# 8. Reachability Index (Transitive Closure on the Condensation)
+# ============================================================
+def _pack_descendants(count, dag_offsets, dag_targets):
+    """
+    Bit-packed descendant sets, one row per component, in one flat bytearray.
+    Component ids are in topological order (edges go c -> d with d > c), so row c
+    only stores bits for d >= c: bit (d - c) is set when c reaches d.
+    Rows are filled in reverse topological order; each child row is merged with a
+    single shift + OR on Python ints (word-wide, in C), then packed back.
+    Total size is about count^2 / 16 bytes.
+    """
+    row_offsets = array('q', [0]) * (count + 1)
+    for c in range(count):
+        row_offsets[c + 1] = row_offsets[c] + ((count - c + 7) >> 3)
+    bits = bytearray(row_offsets[count])
+    view = memoryview(bits)
+    for c in range(count - 1, -1, -1):
+        row = 1 # Bit 0: a component reaches itself
+        for i in range(dag_offsets[c], dag_offsets[c + 1]):
+            d = dag_targets[i]
+            row |= int.from_bytes(view[row_offsets[d]:row_offsets[d + 1]], "little") << (d - c)
+        view[row_offsets[c]:row_offsets[c + 1]] = row.to_bytes(row_offsets[c + 1] - row_offsets[c], "little")
+    return row_offsets, bits
+
+def compute_reachability_index(nodes, edges, is_directed=True, graph=None):
+    """
+    Built once per graph; afterwards `is_reachable` answers in O(1).
+    Directed: SCCs (iterative Kosaraju) are collapsed and descendant bitsets are
+    computed over the condensation DAG. Undirected: reachability is simply
+    "same connected component" (union-find), so no bitset is stored at all
+    (row_offsets / bits are None) and lookups compare component ids.
+    """
+    if is_directed:
+        node_map, offsets, targets, r_offsets, r_targets = _directed_csr_pair(nodes, edges, graph)
+        scc_ids, count = _kosaraju_scc_ids(len(node_map), offsets, targets, r_offsets, r_targets,
+                                           _search_sequence(len(node_map), -1))
+        dag_offsets, dag_targets, _, _ = _build_condensation_csr(offsets, targets, scc_ids, count)
+        comp_ids = array('q', scc_ids)
+    else:
+        stats = graph.component_stats() if graph is not None else compute_components_union_find(nodes, edges)
+        node_map, comp_ids, count = stats["node_map"], stats["component_ids"], stats["count"]
+        return {
+            "node_map": node_map,
+            "comp_ids": comp_ids,
+            "count": count,
+            "row_offsets": None,
+            "bits": None,
+            "nbytes": len(comp_ids) * 8,
+        }
+
+    row_offsets, bits = _pack_descendants(count, dag_offsets, dag_targets)
+    return {
+        "node_map": node_map,
+        "comp_ids": comp_ids,
+        "count": count,
+        "row_offsets": row_offsets,
+        "bits": bits,
+        "nbytes": len(bits) + (len(row_offsets) + len(comp_ids)) * 8,
+    }
+
+def _reaches(index, u_idx, v_idx):
+    """O(1) lookup by node index."""
+    c, d = index["comp_ids"][u_idx], index["comp_ids"][v_idx]
+    if index["bits"] is None: # Undirected: same component
+        return c == d
+    if d < c:
+        return False
+    k = d - c
+    return (index["bits"][index["row_offsets"][c] + (k >> 3)] >> (k & 7)) & 1 == 1
+
+def is_reachable(index, source, target):
+    """Can `source` reach `target`? (labels; False if either is unknown)"""
+    u_idx = _lookup_index(index["node_map"], source)
+    v_idx = _lookup_index(index["node_map"], target)
+    if u_idx == -1 or v_idx == -1:
+        return False
+    return _reaches(index, u_idx, v_idx)
+
+# ============================================================
+# 9. Node Search Index (Prefix / Substring Lookup)
+# ============================================================
+def build_node_search_index(node_map):
+    """
+    Built once per graph over the sorted label table (`node_map`).
+    keys: casefolded labels in string order (prefix search = one bisect);
+    order[k]: node index of keys[k];
+    text: keys joined by newlines, so substring search is a C-speed str.find scan;
+    starts[k]: offset of keys[k] inside text.
+    """
+    n = len(node_map)
+    labels = [str(node_map[i]).casefold() for i in range(n)]
+    order = sorted(range(n), key=labels.__getitem__)
+    keys = [labels[i] for i in order]
+    del labels
+
+    starts = array('q', [0]) * n
+    pos = 0
+    for k in range(n):
+        starts[k] = pos
+        pos += len(keys[k]) + 1
+    return {"node_map": node_map, "keys": keys, "order": array('q', order), "text": "\n".join(keys), "starts": starts}
+
+def search_nodes(index, query, k=20):
+    """
+    Top-k labels matching `query` (case-insensitive): prefix matches first,
+    then substring matches, each group in string order.
+    An empty query returns the first k nodes of the label table.
+    """
+    node_map, keys, order = index["node_map"], index["keys"], index["order"]
+    query = str(query).strip().casefold()
+    if not query:
+        return [node_map[i] for i in range(min(k, len(node_map)))]
+    if "\n" in query:
+        return []
+
+    # 1. Prefix matches: contiguous run starting at the bisect position
+    hits = []
+    j = bisect_left(keys, query)
+    while j < len(keys) and len(hits) < k and keys[j].startswith(query):
+        hits.append(order[j])
+        j += 1
+
+    # 2. Substring matches (prefix matches were all taken if we get here)
+    text, starts = index["text"], index["starts"]
+    pos = text.find(query)
+    while pos != -1 and len(hits) < k:
+        slot = bisect_right(starts, pos) - 1
+        if not keys[slot].startswith(query):
+            hits.append(order[slot])
+        if slot + 1 == len(keys):
+            break
+        pos = text.find(query, starts[slot + 1]) # One hit per label
+    return [node_map[i] for i in hits]
+
+def locate_node(index, label):
+    """Node index of `label` in the label table (-1 if absent)."""
+    return _lookup_index(index["node_map"], label)
+
+# ============================================================
+# 10. Result-only Engines (no step snapshots)
+# ============================================================
+# Same traversal order as the run_* engines, iterative (no recursion limit),
+# over CSR arrays. Each returns exactly the final snapshot of its trace engine,
+# so headless/batch callers pay O(V + E) instead of one snapshot per step.
+def _result_csr(nodes, edges, is_directed, graph=None, reverse=False):
+    """(node_map, offsets, targets) from the shared store or the sort-based builder."""
+    if graph is not None:
+        adj = graph.adjacency(is_directed, reverse)
+        return graph.node_map, adj.offsets, adj.targets
+    node_map = _sorted_unique(nodes)
+    offsets, targets = _build_csr(len(node_map), edges, node_map, is_directed, reverse)
+    return node_map, offsets, targets
+
+def _result_sequence(node_map, start_node):
+    start_idx = _lookup_index(node_map, start_node) if start_node is not None else -1
+    return _search_sequence(len(node_map), start_idx)
+
+def compute_bfs(nodes, edges, start_node, is_directed=False, graph=None):
+    """Final snapshot of run_bfs_simulation (levels, tree edges, components)."""
+    node_map, offsets, targets = _result_csr(nodes, edges, is_directed, graph)
+    n = len(node_map)
+    visited = [False] * n
+    levels = [-1] * n
+    visit_order = []
+    edge_types = {}
+    comp_count = 0
+
+    for root in _result_sequence(node_map, start_node):
+        if visited[root]: continue
+        comp_count += 1
+        visited[root] = True
+        levels[root] = 0
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            visit_order.append(u)
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if not visited[v]:
+                    visited[v] = True
+                    levels[v] = levels[u] + 1
+                    u_str, v_str = node_map[u], node_map[v]
+                    edge_types[(u_str, v_str) if is_directed else tuple(sorted((u_str, v_str)))] = "tree"
+                    queue.append(v)
+
+    return _make_snapshot_bfs_dfs(node_map, visited, visit_order, [], [], levels, edge_types, comp_count,
+                                  f"✅ BFS Traversal Complete. (Total Components: {comp_count})", algo_style="BFS")
+
+def compute_dfs(nodes, edges, start_node, is_directed=False, graph=None):
+    """Final snapshot of run_dfs_simulation (depths, tree/back/cross edges, components)."""
+    node_map, offsets, targets = _result_csr(nodes, edges, is_directed, graph)
+    n = len(node_map)
+    colors = [0] * n
+    depths = [-1] * n
+    visit_order = []
+    edge_types = {}
+    comp_count = 0
+
+    for root in _result_sequence(node_map, start_node):
+        if colors[root] != 0: continue
+        comp_count += 1
+        colors[root] = 1
+        depths[root] = 0
+        visit_order.append(root)
+        stack, iters = [root], [offsets[root]]
+        while stack:
+            u, i = stack[-1], iters[-1]
+            if i < offsets[u + 1]:
+                iters[-1] = i + 1
+                v = targets[i]
+                if colors[v] == 0: # Tree Edge
+                    e_type = "tree"
+                    colors[v] = 1
+                    depths[v] = depths[u] + 1
+                    visit_order.append(v)
+                    stack.append(v); iters.append(offsets[v])
+                elif colors[v] == 1: # Back Edge (undirected: skip the edge to the parent)
+                    if not is_directed and len(stack) >= 2 and stack[-2] == v: continue
+                    e_type = "back"
+                elif is_directed: # Cross/Forward
+                    e_type = "cross"
+                else:
+                    continue
+                u_str, v_str = node_map[u], node_map[v]
+                edge_types[(u_str, v_str) if is_directed else tuple(sorted((u_str, v_str)))] = e_type
+            else:
+                stack.pop(); iters.pop()
+                colors[u] = 2
+
+    return _make_snapshot_bfs_dfs(node_map, colors, visit_order, [], [], depths, edge_types, comp_count,
+                                  f"✅ DFS Traversal Complete. (Total Components: {comp_count})", algo_style="DFS")
+
+def compute_topological_order(nodes, edges, start_node=None, is_directed=True, graph=None):
+    """Final snapshot of run_topological_sort_simulation (order, or the cycle failure state)."""
+    node_map, offsets, targets = _result_csr(nodes, edges, is_directed, graph)
+    n = len(node_map)
+    colors = [0] * n
+    visit_order = []
+    finish_stack = []
+    comp_count = 0
+
+    for root in _result_sequence(node_map, start_node):
+        if colors[root] != 0: continue
+        comp_count += 1
+        colors[root] = 1
+        visit_order.append(root)
+        stack, iters = [root], [offsets[root]]
+        while stack:
+            u, i = stack[-1], iters[-1]
+            if i < offsets[u + 1]:
+                iters[-1] = i + 1
+                v = targets[i]
+                if colors[v] == 0:
+                    colors[v] = 1
+                    visit_order.append(v)
+                    stack.append(v); iters.append(offsets[v])
+                elif colors[v] == 1: # Cycle
+                    return _make_snapshot_topo(node_map, colors, visit_order, finish_stack, None, comp_count,
+                                               "⛔ Topological Sort Failed (Cycle Detected)")
+            else:
+                stack.pop(); iters.pop()
+                colors[u] = 2
+                finish_stack.append(u)
+
+    ordering = finish_stack[::-1]
+    return _make_snapshot_topo(node_map, colors, ordering, [], None, comp_count,
+                               f"✅ Topological Sort Complete. (Processed {comp_count} Components)")
+
+def compute_scc(nodes, edges, start_node=None, is_directed=True, graph=None):
+    """Final snapshot of run_scc_kosaraju_ui (same groups, group ids and member order)."""
+    node_map, offsets, targets = _result_csr(nodes, edges, is_directed, graph)
+    _, r_offsets, r_targets = _result_csr(nodes, edges, is_directed, graph, reverse=True)
+    n = len(node_map)
+
+    # Phase 1: pre-order + finishing order on the original graph
+    colors = [0] * n
+    visit_order = []
+    order_stack = []
+    for root in _result_sequence(node_map, start_node):
+        if colors[root] != 0: continue
+        colors[root] = 1
+        visit_order.append(root)
+        stack, iters = [root], [offsets[root]]
+        while stack:
+            u, i = stack[-1], iters[-1]
+            if i < offsets[u + 1]:
+                iters[-1] = i + 1
+                v = targets[i]
+                if colors[v] == 0:
+                    colors[v] = 1
+                    visit_order.append(v)
+                    stack.append(v); iters.append(offsets[v])
+            else:
+                stack.pop(); iters.pop()
+                colors[u] = 2
+                order_stack.append(u)
+
+    # Phase 2: pre-order DFS on the transpose, roots popped from the finishing stack
+    colors = [0] * n
+    scc_groups = []
+    while order_stack:
+        root = order_stack.pop()
+        if colors[root] != 0: continue
+        colors[root] = 1
+        group = [root]
+        stack, iters = [root], [r_offsets[root]]
+        while stack:
+            u, i = stack[-1], iters[-1]
+            if i < r_offsets[u + 1]:
+                iters[-1] = i + 1
+                v = r_targets[i]
+                if colors[v] == 0:
+                    colors[v] = 1
+                    group.append(v)
+                    stack.append(v); iters.append(r_offsets[v])
+            else:
+                stack.pop(); iters.pop()
+                colors[u] = 2
+        scc_groups.append(group)
+
+    return _make_snapshot_scc(
+        phase=2, description=f"🏁 SCC Search Complete. (Total SCCs: {len(scc_groups)})",
+        node_map=node_map, colors=colors, visit_order=visit_order,
+        order_stack=[], scc_groups=scc_groups, current_scc=[]
+    )
+
 # ============================================================
 # Snapshot Helpers (Data Bridge)
 # ============================================================
-def _make_snapshot_bfs_dfs(node_map, visited_arr, order_indices, structure_list, active_tuple_list, levels_arr, edge_types_list, comp_cnt, log, algo_style="BFS"):
-    # Convert edge list to dict
-    edge_types_dict = {}
-    if isinstance(edge_types_list, list):
-        for k, t in edge_types_list:
-            edge_types_dict[k] = t
+def _make_snapshot_bfs_dfs(node_map, visited_arr, order_indices, structure_list, active_tuple_list, levels_arr, edge_types, comp_cnt, log, algo_style="BFS"):
+    # Engines keep edge_types as an insertion-ordered dict; one C-level copy per step
+    edge_types_dict = dict(edge_types)
     
     # Flatten structure (Queue/Stack)
     flat_structure = []
@@ -418,7 +1431,7 @@ def _make_snapshot_bfs_dfs(node_map, visited_arr, order_indices, structure_list,
             flat_structure.append(node_map[item])
 
     snapshot = {
-        "visited": [node_map[i] for i, v in enumerate(visited_arr) if v and (isinstance(v, bool) or v > 0)],
+        "visited": [node_map[i] for i, v in enumerate(visited_arr) if v], # bool (BFS) or color > 0 (DFS)
         "visit_order": [node_map[i] for i in order_indices],
         "active_edges": [(node_map[u], node_map[v]) for u, v in active_tuple_list],
         "levels": {node_map[i]: l for i, l in enumerate(levels_arr) if l != -1},
@@ -480,11 +1493,49 @@ def _make_snapshot_scc(phase, description, node_map, colors, visit_order, order_
         "component_count": len(scc_groups)
     }
 
+def _make_snapshot_dag(view, order_labels, queue, active_pairs, levels, comp_count, message):
+    labels = view["dag_nodes"]
+    order = list(order_labels) # Kahn pops = visited set = order; one read-only copy for both keys
+    snapshot = {
+        "visited": order,
+        "visit_order": order,
+        "queue": list(map(labels.__getitem__, queue)),
+        "active_edges": [(labels[c], labels[d]) for c, d in active_pairs],
+        "levels": levels,
+        "edge_types": {},
+        "component_count": comp_count,
+        "log": message,
+    }
+    snapshot.update(view)
+    return snapshot
+
+def _make_snapshot_bidir(view, frontier_s, frontier_t, active_pairs, path_pairs, path, message):
+    node_map, is_directed = view["node_map"], view["is_directed"]
+    dist_s, dist_t = view["dist_s"], view["dist_t"]
+    edge_types = {}
+    for u, v in path_pairs:
+        u_str, v_str = node_map[u], node_map[v]
+        edge_types[(u_str, v_str) if is_directed else tuple(sorted((u_str, v_str)))] = "tree"
+
+    return {
+        "visited": [node_map[i] for i in view["touched"]],
+        "visit_order": [node_map[i] for i in view["touched"]],
+        "queue": [node_map[i] for i in frontier_s] + [node_map[i] for i in frontier_t],
+        "active_edges": [(node_map[u], node_map[v]) for u, v in active_pairs],
+        "levels": {node_map[i]: dist_s[i] for i in view["touched"] if dist_s[i] != -1},
+        "levels_t": {node_map[i]: dist_t[i] for i in view["touched"] if dist_t[i] != -1},
+        "edge_types": edge_types,
+        "path": [node_map[i] for i in path] if path is not None else None,
+        "hops": len(path) - 1 if path else None, # path=[]: search finished, no path
+        "component_count": 0,
+        "log": message,
+    }
+
 # ============================================================
 # View Helpers
 # ============================================================
-def get_adjacency_matrix(nodes, edges, is_directed=False):
-    sorted_nodes = _create_mapping_list(nodes)
+def get_adjacency_matrix(nodes, edges, is_directed=False, graph=None):
+    sorted_nodes = graph.node_map if graph is not None else _create_mapping_list(nodes)
     n = len(sorted_nodes)
     matrix = [[0] * n for _ in range(n)]
     
@@ -498,10 +1549,19 @@ def get_adjacency_matrix(nodes, edges, is_directed=False):
             
     return sorted_nodes, matrix
 
-def get_adjacency_list_text(nodes, edges, is_directed=False):
-    sorted_nodes = _create_mapping_list(nodes)
+def get_reachability_matrix(nodes, edges, is_directed=False, graph=None, index=None):
+    """Same layout as get_adjacency_matrix; each cell is an O(1) index lookup."""
+    if index is None:
+        index = graph.reachability_index(is_directed) if graph is not None else \
+            compute_reachability_index(nodes, edges, is_directed)
+    sorted_nodes = index["node_map"]
+    n = len(sorted_nodes)
+    matrix = [[1 if _reaches(index, i, j) else 0 for j in range(n)] for i in range(n)]
+    return sorted_nodes, matrix
+
+def get_adjacency_list_text(nodes, edges, is_directed=False, graph=None):
+    sorted_nodes, adj = _prepare_graph(nodes, edges, is_directed, graph)
     n = len(sorted_nodes)
-    adj = _build_adj_list_indices_no_dict(n, edges, sorted_nodes, is_directed)
     
     lines = []
     for i in range(n):
@@ -0,0 +1,85 @@
+# graph_player.py
+"""
+Client-side incremental renderer (Streamlit custom component).
+
+The graph is laid out once on the server (Graphviz -> SVG). After that the
+browser only receives per-step style deltas (fill, pen width, label, edge
+style) and replays them locally, including autoplay at a given frame rate.
+The SVG and each frame cross the wire once; later reruns send only frames
+the browser does not have yet. Server reruns happen only when playback
+pauses (to sync the side panels) or the browser asks for a resync.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "graph_player")
+_component = components.declare_component("graph_player", path=_FRONTEND_DIR)
+
+
+def diff_styles(prev_styles, curr_styles):
+    """
+    One delta frame between two (node_styles, edge_styles) pairs.
+    Only changed entries are kept: {"n": [[i, fill, color, penwidth, label]], "e": [[k, color, style, penwidth]]}.
+    prev_styles=None produces a full frame.
+    """
+    prev_nodes, prev_edges = prev_styles if prev_styles is not None else ([], [])
+    curr_nodes, curr_edges = curr_styles
+    node_delta = [[i, *style] for i, style in enumerate(curr_nodes)
+                  if i >= len(prev_nodes) or prev_nodes[i] != style]
+    edge_delta = [[k, *style] for k, style in enumerate(curr_edges)
+                  if k >= len(prev_edges) or prev_edges[k] != style]
+    return {"n": node_delta, "e": edge_delta}
+
+
+class FrameCache:
+    """
+    Incrementally extends delta frames as the trace grows (the background
+    worker may still be appending steps). Frame 0 is a full frame.
+    """
+    def __init__(self, token, svg):
+        self.token = token
+        self.svg = svg
+        self.frames = []
+        self._last_styles = None
+        self._svg_sent = False
+        self._frames_sent = 0
+
+    def extend(self, steps, style_fn):
+        for i in range(len(self.frames), len(steps)):
+            styles = style_fn(steps[i])
+            self.frames.append(diff_styles(self._last_styles, styles))
+            self._last_styles = styles
+        return self.frames
+
+    def pending(self):
+        """
+        Payload not yet shipped to the browser: (svg or None, frames_from, new frames).
+        Marks it as sent.
+        """
+        svg = None if self._svg_sent else self.svg
+        frames_from = self._frames_sent
+        new_frames = self.frames[frames_from:]
+        self._svg_sent = True
+        self._frames_sent = len(self.frames)
+        return svg, frames_from, new_frames
+
+    def resync(self):
+        """The browser lost its copy (iframe reload / dropped render): resend everything."""
+        self._svg_sent = False
+        self._frames_sent = 0
+
+
+def graph_player(svg, svg_id, frames, frames_from=0, step=0, fps=4.0, focus=None, height=480, key=None):
+    """
+    Renders the player. `svg` is only needed when `svg_id` is new to the browser
+    (None otherwise); `frames` continue the browser's list at index `frames_from`.
+    `focus` is a node index (SVG id n<i>) to center and zoom the frame on, or None
+    for the full view. `height` is the height of the graph area in pixels.
+    Returns the last browser event, or None before any interaction:
+    {"id", "svg_id", "step"} on pause / manual navigation,
+    {"id", "svg_id", "resync": True} when the browser is missing data.
+    Every event has a fresh "id", so repeating the same step is still a new event.
+    """
+    return _component(svg=svg, svg_id=svg_id, frames=frames, frames_from=frames_from, step=step, fps=fps,
+                      focus=focus, height=height, key=key, default=None)
@@ -0,0 +1,237 @@
+# graph_store.py
+"""
+Process-wide store of loaded graphs, shared by every Streamlit session.
+
+Graphs are keyed by a hash of their raw edge-list content. Sessions hold a
+GraphHandle (reference count); when the last handle is released, the graph
+stays cached as "idle" and is evicted (least recently used first) only when
+the store exceeds its memory cap.
+
+Each entry is read-only: nodes/edges are tuples (or int arrays), and the
+adjacency is built once per direction mode as flat CSR arrays, then reused
+by every session and every simulation.
+"""
+import hashlib
+import os
+import sys
+import threading
+import time
+import weakref
+from array import array
+
+# --- Local Modules ---
+import data_manager
+import functions
+
+DEFAULT_CAP_MB = int(os.environ.get("GRAPH_STORE_CAP_MB", "1024"))
+
+
+class CSRAdjacency:
+    """
+    Immutable adjacency over CSR arrays. adj[u] is a zero-copy memoryview
+    slice of sorted, deduplicated neighbor indices, so it can stand in for
+    the list-of-lists from _build_adj_list_indices_no_dict.
+    """
+    __slots__ = ("offsets", "targets", "_view")
+
+    def __init__(self, offsets, targets):
+        self.offsets = offsets
+        self.targets = targets
+        self._view = memoryview(targets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, u):
+        return self._view[self.offsets[u]:self.offsets[u + 1]]
+
+    def __iter__(self):
+        for u in range(len(self)):
+            yield self[u]
+
+    @property
+    def nbytes(self):
+        return (len(self.offsets) + len(self.targets)) * 8
+
+
+def _build_sorted_csr(n, edges, node_map, is_directed, reverse=False):
+    """
+    Same builder as the store-less path (functions._build_csr), so traces and
+    SCC/component numbering do not depend on whether a shared graph is used.
+    """
+    return CSRAdjacency(*functions._build_csr(n, edges, node_map, is_directed, reverse))
+
+
+def _estimate_bytes(obj):
+    """Rough deep size for node/edge containers (labels counted once per slot)."""
+    if isinstance(obj, array):
+        return obj.buffer_info()[1] * obj.itemsize
+    if isinstance(obj, data_manager.IntEdgeList):
+        return _estimate_bytes(obj.src) + _estimate_bytes(obj.dst)
+    total = sys.getsizeof(obj)
+    for item in obj:
+        if isinstance(item, tuple):
+            total += sys.getsizeof(item) + sum(sys.getsizeof(x) for x in item)
+        else:
+            total += sys.getsizeof(item)
+    return total
+
+
+class SharedGraph:
+    """One immutable loaded graph. Adjacency is built lazily, once per mode."""
+
+    def __init__(self, key, nodes, edges):
+        self.key = key
+        self.nodes = nodes if isinstance(nodes, array) else tuple(nodes)
+        self.edges = edges if isinstance(edges, data_manager.IntEdgeList) else tuple(edges)
+        self.node_map = self.nodes # Already sorted & unique (parse_edge_list)
+        self.ref_count = 0
+        self.last_used = time.monotonic()
+        self._adjacency = {}
+        self._component_stats = None
+        self._reachability = {}
+        self._search_index = None
+        self._search_bytes = 0
+        self._lock = threading.Lock()
+        self.base_bytes = _estimate_bytes(self.nodes) + _estimate_bytes(self.edges)
+
+    def adjacency(self, is_directed, reverse=False):
+        """Shared CSR adjacency (reverse=True: transpose, for SCC phase 2)."""
+        mode = (bool(is_directed), bool(reverse))
+        with self._lock:
+            if mode not in self._adjacency:
+                self._adjacency[mode] = _build_sorted_csr(len(self.node_map), self.edges, self.node_map, is_directed, reverse)
+            return self._adjacency[mode]
+
+    def component_stats(self):
+        with self._lock:
+            if self._component_stats is None:
+                self._component_stats = functions.compute_components_union_find(self.nodes, self.edges)
+            return self._component_stats
+
+    def search_index(self):
+        """Prefix/substring node lookup (functions.build_node_search_index)."""
+        with self._lock:
+            if self._search_index is None:
+                index = functions.build_node_search_index(self.node_map)
+                # Sized once here: nbytes is polled on every store eviction check
+                self._search_bytes = (_estimate_bytes(index["keys"]) + sys.getsizeof(index["text"])
+                                      + _estimate_bytes(index["order"]) + _estimate_bytes(index["starts"]))
+                self._search_index = index
+            return self._search_index
+
+    def reachability_index(self, is_directed):
+        """Bit-packed transitive closure (functions.compute_reachability_index), built once per mode."""
+        mode = bool(is_directed)
+        if mode not in self._reachability:
+            # Built outside the lock: it takes the adjacency/component locks itself
+            index = functions.compute_reachability_index(self.nodes, self.edges, mode, graph=self)
+            with self._lock:
+                self._reachability.setdefault(mode, index)
+        return self._reachability[mode]
+
+    @property
+    def nbytes(self):
+        total = self.base_bytes + sum(adj.nbytes for adj in self._adjacency.values()) + self._search_bytes
+        stats = self._component_stats
+        if stats is not None:
+            total += _estimate_bytes(stats["component_ids"]) + _estimate_bytes(stats["sizes"])
+        for index in self._reachability.values():
+            # The undirected index is just component_stats' component_ids (counted above)
+            if stats is None or index["comp_ids"] is not stats["component_ids"]:
+                total += index["nbytes"]
+        return total
+
+
+class GraphHandle:
+    """
+    A session's reference to a SharedGraph. Released explicitly on reload,
+    or automatically when the session state is garbage-collected.
+    """
+    def __init__(self, store, graph):
+        self.graph = graph
+        self._finalizer = weakref.finalize(self, store.release, graph)
+
+    def release(self):
+        self._finalizer()
+
+
+class GraphStore:
+    def __init__(self, cap_mb=DEFAULT_CAP_MB):
+        self.cap_bytes = cap_mb * 1024 * 1024
+        self._graphs = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_key(content, numeric_ids=False):
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{digest}:{'int' if numeric_ids else 'str'}"
+
+    def acquire(self, content, numeric_ids=False):
+        """Parse (or reuse) the graph for this content and return a new handle."""
+        key = self.content_key(content, numeric_ids)
+        with self._lock:
+            # Lookup and ref_count increment in one critical section: an idle graph
+            # cannot be evicted between being found and being referenced
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._ref_locked(graph)
+                return GraphHandle(self, graph)
+
+        # Parse outside the lock; if two sessions race, the first insert wins
+        nodes, edges = data_manager.parse_edge_list(content, numeric_ids=numeric_ids)
+        candidate = SharedGraph(key, nodes, edges)
+        with self._lock:
+            graph = self._graphs.setdefault(key, candidate)
+            self._ref_locked(graph)
+        return GraphHandle(self, graph)
+
+    def _ref_locked(self, graph):
+        graph.ref_count += 1
+        graph.last_used = time.monotonic()
+        self._evict_locked()
+
+    def release(self, graph):
+        """
+        Drop one reference to this exact graph. A graph that was already evicted
+        (or replaced under the same key) never touches the stored one.
+        """
+        with self._lock:
+            graph.ref_count = max(graph.ref_count - 1, 0)
+            graph.last_used = time.monotonic()
+            if self._graphs.get(graph.key) is graph:
+                self._evict_locked()
+
+    def _evict_locked(self):
+        """Drop idle graphs (ref_count == 0), least recently used first, until under the cap."""
+        total = sum(g.nbytes for g in self._graphs.values())
+        if total <= self.cap_bytes:
+            return
+        idle = sorted((g for g in self._graphs.values() if g.ref_count == 0), key=lambda g: g.last_used)
+        for graph in idle:
+            if total <= self.cap_bytes:
+                break
+            total -= graph.nbytes
+            del self._graphs[graph.key]
+
+    def stats(self):
+        with self._lock:
+            graphs = list(self._graphs.values())
+        return {
+            "graphs": len(graphs),
+            "in_use": sum(1 for g in graphs if g.ref_count > 0),
+            "bytes": sum(g.nbytes for g in graphs),
+            "cap_bytes": self.cap_bytes,
+        }
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+def get_store():
+    """Process-wide singleton (shared by every Streamlit session in this server)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = GraphStore()
+        return _STORE
@@ -0,0 +1,413 @@
+# parallel_scc.py
+"""
+Result-only parallel SCC engine for very large directed graphs.
+
+Pipeline:
+  1. CSR build: the parent maps labels to indices and counts degrees (numpy);
+     the pool scatters forward and transpose targets, one node range per task.
+  2. Trim: nodes with zero in- or out-degree (inside their partition) are trivial SCCs.
+     On the whole graph this runs in rounds, one node range per task.
+  3. Forward-Backward (FW-BW): pick a pivot, SCC(pivot) = FW(pivot) ∩ BW(pivot).
+     FW and BW run as two concurrent tasks. The three leftovers (FW only, BW only,
+     neither) cannot share an SCC, so each becomes an independent partition.
+  4. Independent partitions are solved across the pool. Small partitions are
+     finished inside the worker with an iterative Tarjan.
+
+All n- and E-length arrays (CSR, partition ids, FW/BW marks, results) live in
+shared memory, once. A node belongs to exactly one live partition, so tasks of
+different partitions write disjoint entries; worker scratch is per partition.
+Groups match `run_scc_kosaraju_ui` / `functions.compute_condensation` (as sets).
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# --- Local Modules ---
+import functions
+
+SMALL_PARTITION = 20000 # Below this size a partition is finished with sequential Tarjan
+TRIM_MIN_FRACTION = 0.01 # Parallel trim rounds stop once a round removes less than this share
+
+# Shared arrays: name -> length (n = node count, m = edge count)
+_LAYOUT = (
+    ("src", "m"), ("dst", "m"),           # Edge endpoints as node indices
+    ("f_off", "n+1"), ("f_tgt", "m"),     # Forward CSR
+    ("r_off", "n+1"), ("r_tgt", "m"),     # Transpose CSR
+    ("part", "n"),                        # Partition id of each live node (-1: SCC found)
+    ("fw", "n"), ("bw", "n"),             # == partition id -> reached by forward / backward search
+    ("rep", "n"),                         # SCC representative (any member) per node
+)
+
+# Per-process views of the shared arrays, set by _attach_graph:
+# _G[name] is a memoryview (fast scalar access), _G["np"][name] a numpy array
+_G = {}
+
+
+# ============================================================
+# Graph Attachment (parent: local arrays / workers: shared memory)
+# ============================================================
+def _attach_graph(arrays, keep_alive=()):
+    _G.clear()
+    _G.update({name: memoryview(arr) for name, arr in arrays.items()})
+    _G["np"] = arrays
+    _G["keep_alive"] = keep_alive
+
+def _init_worker(shm_specs):
+    """Pool initializer: attach to the shared blocks created by the parent."""
+    blocks, arrays = [], {}
+    for name, (shm_name, length) in shm_specs.items():
+        # Pool workers share the parent's resource tracker; the parent unlinks the block
+        shm = shared_memory.SharedMemory(name=shm_name)
+        blocks.append(shm)
+        arrays[name] = np.ndarray((length,), dtype=np.int64, buffer=shm.buf)
+    _attach_graph(arrays, keep_alive=blocks)
+
+def _allocate(lengths, shared):
+    """int64 arrays by name; in shared memory when a pool will read them."""
+    blocks, arrays = {}, {}
+    for name, length in lengths.items():
+        if shared:
+            shm = shared_memory.SharedMemory(create=True, size=max(length, 1) * 8)
+            blocks[name] = shm
+            arrays[name] = np.ndarray((length,), dtype=np.int64, buffer=shm.buf)
+        else:
+            arrays[name] = np.empty(length, dtype=np.int64)
+    return blocks, arrays
+
+def _edge_indices(node_map, edges):
+    """Edge endpoints as node indices (edges with unknown endpoints are dropped)."""
+    if functions._is_int_node_array(node_map) and hasattr(edges, "src"):
+        # Integer ids: one vectorized search over the sorted id table
+        table = np.frombuffer(node_map, dtype=np.int64)
+        src = np.frombuffer(edges.src, dtype=np.int64)
+        dst = np.frombuffer(edges.dst, dtype=np.int64)
+        if not len(table):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        u_idx = np.minimum(np.searchsorted(table, src), len(table) - 1)
+        v_idx = np.minimum(np.searchsorted(table, dst), len(table) - 1)
+        keep = (table[u_idx] == src) & (table[v_idx] == dst)
+        return u_idx[keep], v_idx[keep]
+    index = {node: i for i, node in enumerate(node_map)}
+    pairs = [(index[u], index[v]) for u, v in edges if u in index and v in index]
+    flat = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    return flat[:, 0].copy(), flat[:, 1].copy()
+
+def _node_ranges(offsets, parts):
+    """Split the node range into up to `parts` ranges holding about the same number of edges."""
+    n = len(offsets) - 1
+    cuts = np.searchsorted(offsets, np.linspace(0, offsets[-1], parts + 1)[1:-1])
+    bounds = np.unique(np.concatenate(([0], np.minimum(cuts, n), [n]))).tolist()
+    return list(zip(bounds, bounds[1:]))
+
+
+# ============================================================
+# Whole-Graph Tasks (one node range each; ranges never overlap)
+# ============================================================
+def _fill_csr(lo, hi, reverse):
+    """Scatter the targets of sources lo..hi-1 into their (precomputed) CSR slots."""
+    g = _G["np"]
+    s, d = (g["dst"], g["src"]) if reverse else (g["src"], g["dst"])
+    off, tgt = (g["r_off"], g["r_tgt"]) if reverse else (g["f_off"], g["f_tgt"])
+    sel = np.flatnonzero((s >= lo) & (s < hi))
+    tgt[off[lo]:off[hi]] = d[sel[np.argsort(s[sel], kind="stable")]]
+
+def _live_counts(off, tgt, part, pid, lo, hi):
+    """Neighbors of each node in lo..hi-1 that are still in partition pid."""
+    hits = np.concatenate(([0], np.cumsum(part[tgt[off[lo]:off[hi]]] == pid)))
+    return hits[off[lo + 1:hi + 1] - off[lo]] - hits[off[lo:hi] - off[lo]]
+
+def _trim_range(lo, hi, pid):
+    """
+    One trim round over nodes lo..hi-1. Other ranges may remove nodes at the same
+    time; that is safe, because a removed node is a trivial SCC either way.
+    Returns the number of removed nodes.
+    """
+    g = _G["np"]
+    part = g["part"]
+    out_cnt = _live_counts(g["f_off"], g["f_tgt"], part, pid, lo, hi)
+    in_cnt = _live_counts(g["r_off"], g["r_tgt"], part, pid, lo, hi)
+    removed = lo + np.flatnonzero((part[lo:hi] == pid) & ((out_cnt == 0) | (in_cnt == 0)))
+    part[removed] = -1
+    g["rep"][removed] = removed
+    return len(removed)
+
+
+# ============================================================
+# Partition Tasks (runs in workers and in the parent)
+# ============================================================
+def _reach(pivot, pid, forward):
+    """Search from pivot restricted to partition pid; marks fw (or bw) with pid."""
+    off, tgt, mark = (_G["f_off"], _G["f_tgt"], _G["fw"]) if forward else (_G["r_off"], _G["r_tgt"], _G["bw"])
+    part = _G["part"]
+    mark[pivot] = pid
+    stack = [pivot]
+    while stack:
+        u = stack.pop()
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            if part[v] == pid and mark[v] != pid:
+                mark[v] = pid
+                stack.append(v)
+
+def _split(members, pid, pivot):
+    """SCC(pivot) = FW ∩ BW; returns the three leftover partitions (non-empty only)."""
+    g = _G["np"]
+    in_fw = g["fw"][members] == pid
+    in_bw = g["bw"][members] == pid
+    scc = members[in_fw & in_bw]
+    g["part"][scc] = -1
+    g["rep"][scc] = pivot
+    leftovers = (members[in_fw & ~in_bw], members[in_bw & ~in_fw], members[~in_fw & ~in_bw])
+    return [p for p in leftovers if len(p)]
+
+def _trim(members, pid):
+    """
+    Repeatedly remove nodes with no in- or out-edges inside the partition.
+    Each removed node is its own (trivial) SCC. Returns the surviving members
+    and their in-partition (out, in) degrees.
+    """
+    f_off, f_tgt, r_off, r_tgt = _G["f_off"], _G["f_tgt"], _G["r_off"], _G["r_tgt"]
+    part, rep = _G["part"], _G["rep"]
+    out_deg, in_deg = {}, {}
+
+    queue = []
+    for u in members:
+        out_cnt = 0
+        for i in range(f_off[u], f_off[u + 1]):
+            if part[f_tgt[i]] == pid: out_cnt += 1
+        in_cnt = 0
+        for i in range(r_off[u], r_off[u + 1]):
+            if part[r_tgt[i]] == pid: in_cnt += 1
+        out_deg[u], in_deg[u] = out_cnt, in_cnt
+        if out_cnt == 0 or in_cnt == 0:
+            queue.append(u)
+
+    while queue:
+        u = queue.pop()
+        if part[u] != pid: continue
+        part[u] = -1 # Remove from partition
+        rep[u] = u
+        for i in range(f_off[u], f_off[u + 1]):
+            v = f_tgt[i]
+            if part[v] == pid:
+                in_deg[v] -= 1
+                if in_deg[v] == 0: queue.append(v)
+        for i in range(r_off[u], r_off[u + 1]):
+            v = r_tgt[i]
+            if part[v] == pid:
+                out_deg[v] -= 1
+                if out_deg[v] == 0: queue.append(v)
+
+    return [u for u in members if part[u] == pid], out_deg, in_deg
+
+def _tarjan(members, pid):
+    """Iterative Tarjan restricted to the partition."""
+    f_off, f_tgt, part, rep = _G["f_off"], _G["f_tgt"], _G["part"], _G["rep"]
+    on_stack = -2 - pid # Still distinct from every live partition id
+    index_of, low = {}, {}
+    scc_stack = []
+    for root in members:
+        if root in index_of: continue
+        index_of[root] = low[root] = len(index_of)
+        scc_stack.append(root)
+        part[root] = on_stack
+        call = [(root, f_off[root])]
+        while call:
+            u, i = call[-1]
+            if i < f_off[u + 1]:
+                call[-1] = (u, i + 1)
+                v = f_tgt[i]
+                if part[v] == pid: # In partition, unvisited
+                    index_of[v] = low[v] = len(index_of)
+                    scc_stack.append(v)
+                    part[v] = on_stack
+                    call.append((v, f_off[v]))
+                elif part[v] == on_stack and index_of[v] < low[u]:
+                    low[u] = index_of[v]
+            else:
+                call.pop()
+                if call:
+                    parent = call[-1][0]
+                    if low[u] < low[parent]: low[parent] = low[u]
+                if low[u] == index_of[u]:
+                    while True:
+                        w = scc_stack.pop()
+                        part[w] = -1
+                        rep[w] = u
+                        if w == u: break
+
+def solve_partition(members, pid, small_partition=SMALL_PARTITION):
+    """
+    One unit of work: trim, then full Tarjan when small.
+    Returns None when the partition is solved, else (pivot, surviving members)
+    for an FW-BW split.
+    """
+    part = _G["np"]["part"]
+    part[members] = pid
+    survivors, out_deg, in_deg = _trim(members.tolist(), pid)
+    if not survivors:
+        return None
+    if len(survivors) <= small_partition:
+        _tarjan(survivors, pid)
+        return None
+
+    # Pivot: largest in*out degree tends to sit in the biggest SCC
+    pivot = max(survivors, key=lambda u: out_deg[u] * in_deg[u])
+    return pivot, np.array(survivors, dtype=np.int64)
+
+
+# ============================================================
+# Scheduling
+# ============================================================
+class _InlinePool:
+    """Single-process stand-in for the executor: each task runs on submit."""
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+def _solve_all(pool, arrays, tasks, small_partition):
+    n = len(arrays["part"])
+
+    # 1. CSR scatter, one node range per task
+    futures = [pool.submit(_fill_csr, lo, hi, reverse)
+               for reverse in (False, True)
+               for lo, hi in _node_ranges(arrays["r_off" if reverse else "f_off"], tasks)]
+    for future in futures:
+        future.result()
+
+    # 2. Trim rounds on the whole graph (partition 1), one node range per task
+    ranges = _node_ranges(arrays["f_off"], tasks)
+    live = n
+    while live:
+        removed = sum(f.result() for f in [pool.submit(_trim_range, lo, hi, 1) for lo, hi in ranges])
+        live -= removed
+        if removed == 0 or removed < live * TRIM_MIN_FRACTION:
+            break
+
+    # 3. FW-BW splits; every split of a partition runs FW and BW concurrently
+    next_pid = 2
+    running = {}
+    def split_later(pivot, members, pid):
+        state = {"pivot": pivot, "members": members, "pid": pid, "left": 2}
+        for forward in (True, False):
+            running[pool.submit(_reach, pivot, pid, forward)] = ("reach", state)
+    def solve_later(members):
+        nonlocal next_pid
+        running[pool.submit(solve_partition, members, next_pid, small_partition)] = ("solve", next_pid)
+        next_pid += 1
+
+    members = np.flatnonzero(arrays["part"] == 1)
+    if len(members) > small_partition:
+        # Trimmed in rounds already: pivot by whole-graph degrees
+        degrees = np.diff(arrays["f_off"])[members] * np.diff(arrays["r_off"])[members]
+        split_later(int(members[np.argmax(degrees)]), members, 1)
+    elif len(members):
+        solve_later(members)
+
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            kind, data = running.pop(future)
+            result = future.result()
+            if kind == "solve":
+                if result is not None:
+                    split_later(result[0], result[1], data)
+            elif kind == "reach":
+                data["left"] -= 1
+                if data["left"] == 0:
+                    running[pool.submit(_split, data["members"], data["pid"], data["pivot"])] = ("split", None)
+            else:
+                for part in result:
+                    solve_later(part)
+
+
+# ============================================================
+# Public Entry Point
+# ============================================================
+def compute_scc_parallel(nodes, edges, workers=None, small_partition=SMALL_PARTITION):
+    """
+    Parallel SCC decomposition (result only, no step snapshots).
+    Returns {"node_map", "scc_ids", "components"}; components are ordered by
+    their smallest node index so the output is deterministic.
+    """
+    node_map = functions._sorted_unique(nodes)
+    n = len(node_map)
+    src, dst = _edge_indices(node_map, edges)
+    m = len(src)
+
+    workers = workers or os.cpu_count() or 1
+    shared = workers > 1 and n > small_partition
+    sizes = {"n": n, "n+1": n + 1, "m": m}
+    blocks, arrays = _allocate({name: sizes[size] for name, size in _LAYOUT}, shared)
+    try:
+        arrays["src"][:], arrays["dst"][:] = src, dst
+        del src, dst
+        # CSR offsets from degree counts; targets are scattered by the tasks
+        for off, ends in ((arrays["f_off"], arrays["src"]), (arrays["r_off"], arrays["dst"])):
+            off[0] = 0
+            np.cumsum(np.bincount(ends, minlength=n), out=off[1:])
+        del off, ends # Views into shared blocks must not outlive them
+        arrays["part"].fill(1)
+        arrays["fw"].fill(0)
+        arrays["bw"].fill(0)
+        arrays["rep"].fill(-1)
+
+        if shared:
+            specs = {name: (shm.name, len(arrays[name])) for name, shm in blocks.items()}
+            # spawn, not fork: callers such as the Streamlit server are multi-threaded,
+            # and forking a threaded process can deadlock the children
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_worker, initargs=(specs,))
+        else:
+            _attach_graph(arrays)
+            pool = _InlinePool()
+        with pool:
+            _solve_all(pool, arrays, max(workers, 1), small_partition)
+        rep = arrays["rep"].copy()
+    finally:
+        _G.clear()
+        arrays.clear()
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+    # Canonical ids: order components by their smallest member index
+    _, first, inverse = np.unique(rep, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(len(first))
+    scc_ids = rank[inverse].tolist()
+    components = [[] for _ in range(len(first))]
+    for u, cid in enumerate(scc_ids):
+        components[cid].append(node_map[u])
+
+    return {"node_map": node_map, "scc_ids": scc_ids, "components": components}
+
+def compute_scc_parallel_snapshot(nodes, edges, start_node=None, is_directed=True, graph=None, workers=None):
+    """
+    compute_scc_parallel in the final-snapshot shape of functions.compute_scc
+    (same groups; ids follow the smallest member, not Kosaraju's finishing order).
+    start_node / graph are accepted for engine-signature compatibility only.
+    """
+    result = compute_scc_parallel(nodes, edges, workers)
+    components = result["components"]
+    return {
+        "visited": list(result["node_map"]),
+        "stack": [],
+        "scc_groups": {node: gid for gid, group in enumerate(components) for node in group},
+        "log": f"🏁 SCC Search Complete. (Total SCCs: {len(components)})",
+        "active_edges": [],
+        "levels": {},
+        "visit_order": [],
+        "edge_types": {},
+        "component_count": len(components),
+    }
@@ -0,0 +1,90 @@
+# simulation_worker.py
+"""
+Runs a `functions.run_*` engine on a background thread so the Streamlit
+script never blocks. The engine appends snapshots into a StepBuffer; the UI
+reads that same list while it grows, so stepping can start immediately.
+"""
+import threading
+import time
+
+
+class SimulationCancelled(Exception):
+    """Raised inside the engine (from StepBuffer.append) to stop a run."""
+
+
+class StepBuffer(list):
+    """
+    Append-only step list shared between the worker thread and the UI.
+    list.append is atomic in CPython, so readers can safely index steps[:len].
+    Every append doubles as a cancellation checkpoint.
+    """
+    def __init__(self, cancel_event):
+        super().__init__()
+        self._cancel_event = cancel_event
+        self.nodes_visited = 0
+
+    def append(self, snapshot):
+        if self._cancel_event.is_set():
+            raise SimulationCancelled()
+        self.nodes_visited = len(snapshot.get("visited", []))
+        super().append(snapshot)
+
+
+class SimulationWorker:
+    """
+    One background trace generation, owned by a single Streamlit session
+    (stored in st.session_state). Status: "running" -> "done" | "cancelled" | "error".
+    """
+    def __init__(self, engine, total_nodes=0, **engine_kwargs):
+        self.engine = engine
+        self.engine_kwargs = engine_kwargs
+        self.total_nodes = total_nodes
+        self._cancel_event = threading.Event()
+        self.steps = StepBuffer(self._cancel_event)
+        self.status = "idle"
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._thread = None
+
+    def start(self):
+        self.status = "running"
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="simulation-worker", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.engine(steps=self.steps, **self.engine_kwargs)
+            self.status = "done"
+        except SimulationCancelled:
+            self.status = "cancelled"
+        except Exception as exc: # Surface engine errors in the UI instead of killing the thread silently
+            self.error = exc
+            self.status = "error"
+        finally:
+            self.finished_at = time.perf_counter()
+
+    def cancel(self):
+        """Request a stop; the engine aborts at its next emitted step."""
+        self._cancel_event.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def is_running(self):
+        return self.status == "running"
+
+    def progress(self):
+        """Snapshot of progress counters for the UI."""
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return {
+            "status": self.status,
+            "steps_emitted": len(self.steps),
+            "nodes_visited": self.steps.nodes_visited,
+            "total_nodes": self.total_nodes,
+            "elapsed": (end - self.started_at) if self.started_at is not None else 0.0,
+        }